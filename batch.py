@@ -0,0 +1,43 @@
+"""
+Class-Schedule - Batch Entry Point
+Generates schedules for every account in an account list
+"""
+
+import sys
+from src.batch import load_accounts, run_batch, print_report, write_report
+from src.config import config
+from src.metrics import metrics
+
+
+def main():
+    """Batch execution function: python3 batch.py accounts.csv [workers]"""
+    if len(sys.argv) < 2:
+        print("Usage: python3 batch.py <accounts.csv> [workers]")
+        sys.exit(2)
+
+    try:
+        accounts = load_accounts(sys.argv[1])
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else config.batch_workers
+    except (OSError, ValueError) as e:
+        print(f"Could not read accounts: {e}")
+        sys.exit(2)
+
+    print(f"Processing {len(accounts)} accounts with {workers} workers...")
+    try:
+        results, elapsed = run_batch(accounts, workers)
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user")
+        sys.exit(1)
+
+    print_report(results, elapsed)
+    print(f"📁 Report: {write_report(results, elapsed)}")
+    paths = metrics.export()
+    if paths:
+        print(f"📈 Metrics: {paths[0]}, {paths[1]}")
+
+    if not all(result.success for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
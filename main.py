@@ -5,6 +5,7 @@ Handles university login and schedule extraction workflow
 
 from src.university_login import UniversityLogin
 from src.scraper import Scraper
+from src.metrics import metrics
 import sys
 from src.config import config
 
@@ -13,23 +14,29 @@ def main():
     """Main execution function for the class schedule application"""
 
     portal = UniversityLogin()
+    scraper = None
     
     try:
         username, password = config.get_credentials()
 
         portal.setup_driver()
         print("Attempting login...")
-        login_success = portal.login(username, password)
+        login_success = portal.login_with_cache(username, password)
 
         if login_success:
             print("Login successful! Navigating to courses...")
             
             # Pass the driver to Scraper
-            scraper = Scraper(portal.get_driver(), portal.get_wait())
-            scraper.go_to_courses()
+            scraper = Scraper(portal.get_driver(), portal.get_wait(), portal.create_driver,
+                              username=username)
+            try:
+                scraper.go_to_courses()
+            finally:
+                scraper.close()
 
-        # Keep browser open to inspect
-        input("Press Enter to close browser...")
+        # Keep browser open to inspect (nothing to see when headless)
+        if config.browser_profile != "performance":
+            input("Press Enter to close browser...")
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
@@ -38,23 +45,27 @@ def main():
         sys.exit(1)
     finally:
         # Always cleanup resources
-        cleanup_resources(portal)
+        cleanup_resources(portal, scraper)
+        export_metrics()
 
 
-def cleanup_resources(portal):
+def cleanup_resources(portal, scraper=None):
     """Clean up browser session and temporary files"""
     print("Cleaning up resources...")
 
     # Close browser
     portal.close()
 
-    # Clean up temporary files
-    for file in config.temporary_files:
-        try:
-            open(file, "w").close()
-            print(f"Cleared: {file}")
-        except Exception as e:
-            print(f"Could not clear {file}: {e}")
+    # Clean up the temporary files the scraper wrote
+    if scraper:
+        scraper.clear_temporary_files()
+
+
+def export_metrics():
+    """Write the stage timings of the run for dashboards and node_exporter"""
+    paths = metrics.export()
+    if paths:
+        print(f"Metrics: {paths[0]}, {paths[1]}")
 
 
 if __name__ == "__main__":
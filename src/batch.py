@@ -0,0 +1,201 @@
+"""
+Multi-Account Batch Mode
+Runs login, scraping and ICS creation for many accounts in a bounded worker pool
+"""
+
+import os
+import re
+import csv
+import json
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class Account(NamedTuple):
+    """Portal credentials of one student"""
+    username: str
+    password: str
+
+
+class AccountResult(NamedTuple):
+    """Outcome of processing one account"""
+    username: str
+    success: bool
+    seconds: float
+    output_path: Optional[str] = None
+    courses: int = 0
+    sessions: int = 0
+    error: Optional[str] = None
+
+
+def load_accounts(path: str) -> List[Account]:
+    """Read accounts from a CSV file of username,password rows
+
+    Blank lines and lines starting with # are ignored. Usernames sharing an
+    account_key would overwrite each other's temp directory and output
+    file, so they are rejected.
+
+    Args:
+        path: Path to the account list
+
+    Returns:
+        Accounts in file order
+
+    Raises:
+        ValueError: If a row is malformed or two usernames share a key
+    """
+    accounts = []
+    keys = {}
+    with open(path, newline='', encoding='utf-8') as file:
+        for line_number, row in enumerate(csv.reader(file), 1):
+            if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{path}:{line_number}: expected username,password")
+            username = row[0].strip()
+            key = account_key(username)
+            if key in keys:
+                raise ValueError(f"{path}:{line_number}: {username!r} clashes with {keys[key]!r} "
+                                 f"(both are stored as {key!r})")
+            keys[key] = username
+            accounts.append(Account(username, row[1]))
+    return accounts
+
+
+def account_key(username: str) -> str:
+    """File-system safe name for an account's temp directory and output file"""
+    return re.sub(r'[^\w.-]', '_', username)
+
+
+def run_account(account: Account) -> AccountResult:
+    """Log in, scrape and write the ICS file of one account
+
+    Each account gets its own browser, temp directory and output file, so
+    workers share nothing but the session cache, which is keyed by username.
+
+    Args:
+        account: Account to process
+
+    Returns:
+        AccountResult, also when processing failed
+    """
+    # Imported here so account lists can be handled without Selenium
+    from src.university_login import UniversityLogin
+    from src.scraper import Scraper
+
+    started = time.perf_counter()
+    key = account_key(account.username)
+    output_filename = f"{key}.ics"
+    portal = UniversityLogin()
+    try:
+        portal.setup_driver()
+        if not portal.login_with_cache(account.username, account.password):
+            return AccountResult(account.username, False, time.perf_counter() - started, error="login failed")
+
+        scraper = Scraper(
+            portal.get_driver(), portal.get_wait(), portal.create_driver,
+            temp_dir=os.path.join(config.batch_temp_dir, key),
+            output_dir=config.OUTPUT_DIR,
+            ics_filename=output_filename,
+            show_debug_info=False,
+            username=account.username
+        )
+        try:
+            courses = scraper.go_to_courses()
+        finally:
+            scraper.close()
+            scraper.clear_temporary_files()
+
+        return AccountResult(
+            account.username, True, time.perf_counter() - started,
+            output_path=os.path.join(config.OUTPUT_DIR, output_filename),
+            courses=len(courses),
+            sessions=sum(len(course.sessions) for course in courses)
+        )
+
+    except Exception as e:
+        logger.error(f"Account {account.username} failed: {e}")
+        return AccountResult(account.username, False, time.perf_counter() - started, error=str(e))
+    finally:
+        portal.close()
+
+
+def run_batch(accounts: Iterable[Account], workers: Optional[int] = None,
+              runner: Callable[[Account], AccountResult] = run_account) -> tuple[List[AccountResult], float]:
+    """Process accounts in a bounded pool of workers
+
+    Args:
+        accounts: Accounts to process
+        workers: Accounts processed at the same time, defaults to config.batch_workers
+        runner: Function processing a single account
+
+    Returns:
+        Tuple of (results in account order, wall-clock seconds)
+    """
+    accounts = list(accounts)
+    workers = max(1, min(workers or config.batch_workers, len(accounts) or 1))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="account") as executor:
+        results = list(executor.map(runner, accounts))
+    return results, time.perf_counter() - started
+
+
+def summarize(results: List[AccountResult], elapsed: float) -> dict:
+    """Aggregate counts and throughput of a batch run"""
+    succeeded = [result for result in results if result.success]
+    sessions = sum(result.sessions for result in succeeded)
+    return {
+        'accounts': len(results),
+        'succeeded': len(succeeded),
+        'failed': len(results) - len(succeeded),
+        'courses': sum(result.courses for result in succeeded),
+        'sessions': sessions,
+        'elapsed_seconds': round(elapsed, 3),
+        'accounts_per_minute': round(len(results) * 60 / elapsed, 2) if elapsed else 0.0,
+        'sessions_per_second': round(sessions / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def write_report(results: List[AccountResult], elapsed: float, path: Optional[str] = None) -> str:
+    """Write per-account results and the batch summary as JSON
+
+    Returns:
+        Path of the report
+    """
+    path = path or config.batch_report_path
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    report = {
+        'summary': summarize(results, elapsed),
+        'accounts': [result._asdict() for result in results],
+    }
+    with open(path, "w", encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    return path
+
+
+def print_report(results: List[AccountResult], elapsed: float) -> None:
+    """Print per-account outcomes and aggregate throughput"""
+    print("\n" + "=" * 80)
+    print("📊 BATCH SUMMARY")
+    print("=" * 80)
+    for result in results:
+        if result.success:
+            print(f"✅ {result.username}: {result.courses} classes, {result.sessions} sessions "
+                  f"in {result.seconds:.1f}s -> {result.output_path}")
+        else:
+            print(f"❌ {result.username}: {result.error} ({result.seconds:.1f}s)")
+
+    summary = summarize(results, elapsed)
+    print("=" * 80)
+    print(f"👥 Accounts: {summary['succeeded']}/{summary['accounts']} succeeded")
+    print(f"📅 Sessions: {summary['sessions']}")
+    print(f"⏱️  {summary['elapsed_seconds']}s total, {summary['accounts_per_minute']} accounts/min, "
+          f"{summary['sessions_per_second']} sessions/s")
+    print("=" * 80)
@@ -11,14 +11,118 @@ class Config:
     """Handles application configuration and credentials"""
     OUTPUT_DIR: str = "out"
     TEMP_DIR: str = "src/temp"
+    DEFAULT_BASE_URL: str = "https://vc.farspnu.ac.ir"
     
     def __init__(self):
         
-        self.base_url = "https://vc.farspnu.ac.ir"
-        self.login_url = "https://vc.farspnu.ac.ir/Identity/Account/Login?returnUrl=%2F"
-        self.courses_url = "https://vc.farspnu.ac.ir/Student/Course"
-        self.temporary_files = ["src/temp/dates.html", "src/temp/urls.txt", "src/temp/absolute_urls.txt"]
+        # Portal URLs; set CLASS_SCHEDULE_BASE_URL or call set_base_url() to
+        # point the pipeline at another server such as the mock portal
+        self.set_base_url(os.environ.get("CLASS_SCHEDULE_BASE_URL", self.DEFAULT_BASE_URL))
+
+        # Page extraction mode: "script" collects each page in a single
+        # execute_script call, "element" queries every element through WebDriver
+        self.extraction_mode = "script"
+
+        # Course page fetching: "http" reuses the browser's cookies in a pooled
+        # requests.Session after login, "browser" loads every page in Chrome
+        self.fetch_mode = "http"
+        self.http_pool_size = 10
+        self.http_timeout = 15
+
+        # Pacing shared by every request to the portal (browser and HTTP, all
+        # accounts): a token bucket per host, and a concurrency limit that grows
+        # while it is fully used and responses are fast, and halves on 429/503,
+        # errors or responses slower than rate_limit_slow_seconds
+        self.rate_limit_enabled = True
+        self.rate_limit_per_second = 5.0
+        self.rate_limit_burst = 10
+        self.rate_limit_initial_concurrency = 4
+        self.rate_limit_max_concurrency = 16
+        self.rate_limit_slow_seconds = 5.0
+
+        # Retries of a failed course page, with exponential backoff and jitter
+        self.fetch_retries = 3
+        self.fetch_backoff_base = 0.5
+        self.fetch_backoff_max = 8.0
+
+        # Checkpoint finished course pages so an interrupted run resumes from
+        # them; journals older than run_journal_max_age seconds are discarded
+        self.run_journal_enabled = True
+        self.run_journal_max_age = 24 * 60 * 60
+
+        # Upper bound on course pages fetched at the same time, and on pages
+        # fetched ahead of the parser
+        self.max_concurrent_fetches = 8
+        self.pipeline_buffer_size = 16
+
+        # Session parser backend: "fast" scans the HTML in a single pass,
+        # "bs4" walks a BeautifulSoup tree
+        self.parser_backend = "fast"
+
+        # Entries kept by each DateConverter memoization cache
+        self.date_cache_size = 4096
+
+        # Jalali years covered by the DateConverter.convert_many lookup table
+        self.date_table_first_year = 1300
+        self.date_table_last_year = 1500
+
+        # Reuse parsed sessions of course pages whose HTML did not change
+        self.course_cache_enabled = True
+        self.course_cache_path = os.path.join(self.TEMP_DIR, "course_cache.json")
+        self.course_cache_max_entries = 500
+
+        # Regenerate the calendar against the previous output: unchanged events
+        # stay byte-identical, changed ones get a new SEQUENCE, removed ones are cancelled
+        self.ics_incremental = True
+
+        # Write weekly sessions of a course as one recurring event (RRULE with
+        # EXDATE for skipped weeks) instead of one event per session
+        self.ics_recurrence = True
+
+        # Write intermediate pipeline results to the temp directory for debugging
+        self.persist_temp_files = False
+
+        # Chrome profile: "default" opens a regular visible browser, "performance"
+        # runs headless with eager page loads and no images, fonts, extensions or GPU
+        self.browser_profile = "default"
+
+        # Reuse authenticated cookies from previous runs until they expire
+        self.session_cache_enabled = True
+        self.session_cache_dir = os.path.join(self.TEMP_DIR, "sessions")
+        self.session_cache_ttl = 6 * 60 * 60
+
+        # Seconds to wait for page elements to appear
+        self.wait_timeout = 10
+
+        # Seconds to wait for the portal to accept or reject a login
+        self.login_timeout = 15
+
+        # Extra logged-in Chrome drivers used to load course pages in parallel
+        # in browser fetch mode; 0 loads every page in the login driver
+        self.driver_pool_size = 4
+
+        # Batch mode: accounts processed at the same time (each runs its own
+        # Chrome), and the per-account temp directories
+        self.batch_workers = 2
+        self.batch_temp_dir = os.path.join(self.TEMP_DIR, "accounts")
+        self.batch_report_path = os.path.join(self.OUTPUT_DIR, "batch_report.json")
+
+        # Per-stage timing spans, written at the end of a run as a JSON report
+        # and a Prometheus textfile for node_exporter's textfile collector
+        self.metrics_enabled = True
+        self.metrics_json_path = os.path.join(self.OUTPUT_DIR, "metrics", "run_metrics.json")
+        self.metrics_prometheus_path = os.path.join(self.OUTPUT_DIR, "metrics", "class_schedule.prom")
         
+    def set_base_url(self, base_url: str) -> None:
+        """Point every portal URL at a server
+
+        Args:
+            base_url: Scheme and host of the portal, e.g. http://127.0.0.1:8000
+        """
+        self.base_url = base_url.rstrip("/")
+        self.login_url = f"{self.base_url}/Identity/Account/Login?returnUrl=%2F"
+        self.courses_url = f"{self.base_url}/Student/Course"
+
     def get_credentials(self):
         """Safely get username and password from user input"""
         print("University Portal Login")
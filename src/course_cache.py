@@ -0,0 +1,137 @@
+"""
+Course Content Cache
+Remembers each course page's HTML hash and parsed sessions between runs
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+from src.config import config
+from src.models import Course
+
+logger = logging.getLogger(__name__)
+
+
+class CourseCache:
+    """Per-course cache keyed by URL with least-recently-used eviction"""
+
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None):
+        self.path = path or config.course_cache_path
+        self.max_entries = max_entries if max_entries is not None else config.course_cache_max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def content_hash(html: str) -> str:
+        """Hash of a course page's extracted HTML"""
+        return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+    def _load(self) -> None:
+        """Load cached entries from disk, least recently used first"""
+        try:
+            with open(self.path, "r", encoding='utf-8') as file:
+                entries = json.load(file)
+            self._entries = OrderedDict(entries)
+            logger.debug(f"Loaded {len(self._entries)} cached courses")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable course cache {self.path}: {e}")
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the cache entry for a URL and mark it as recently used
+
+        Args:
+            url: Absolute course page URL
+
+        Returns:
+            Entry with 'hash', 'html', 'classes' (serialized courses) and the HTTP validators
+            'etag' and 'last_modified', or None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def lookup(self, url: str, html: str) -> Optional[List[Course]]:
+        """Get the parsed courses for a URL if its HTML is unchanged
+
+        Args:
+            url: Absolute course page URL
+            html: Freshly fetched course HTML
+
+        Returns:
+            Cached parsed courses, or None if missing or stale
+        """
+        entry = self.get(url)
+        if entry is not None and entry['hash'] == self.content_hash(html):
+            courses = self._courses(entry)
+            if courses is not None:
+                self.hits += 1
+                return courses
+
+        self.misses += 1
+        return None
+
+    def previous(self, url: str) -> Optional[List[Course]]:
+        """Get the courses last parsed for a URL, whatever its current HTML
+
+        Args:
+            url: Absolute course page URL
+
+        Returns:
+            Cached parsed courses, or None if not cached
+        """
+        entry = self.get(url)
+        return self._courses(entry) if entry is not None else None
+
+    @staticmethod
+    def _courses(entry: Dict[str, Any]) -> Optional[List[Course]]:
+        """Deserialize the courses of an entry, None if written in an older format"""
+        try:
+            return [Course.from_dict(course) for course in entry['classes']]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, url: str, html: str, classes: List[Course],
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a course page and its parsed classes, evicting the oldest entries
+
+        Args:
+            url: Absolute course page URL
+            html: Course HTML the classes were parsed from
+            classes: Parsed courses with sessions
+            etag: ETag validator of the HTTP response, if any
+            last_modified: Last-Modified validator of the HTTP response, if any
+        """
+        with self._lock:
+            self._entries[url] = {
+                'hash': self.content_hash(html), 'html': html,
+                'classes': [course.to_dict() for course in classes],
+                'etag': etag, 'last_modified': last_modified
+            }
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Write the cache to disk atomically"""
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with self._lock:
+                with open(temp_path, "w", encoding='utf-8') as file:
+                    json.dump(self._entries, file, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            logger.debug(f"Saved {len(self._entries)} cached courses ({self.hits} hits, {self.misses} misses)")
+        except Exception as e:
+            logger.warning(f"Could not save course cache: {e}")
@@ -0,0 +1,154 @@
+"""
+Batch Date Conversion
+Converts large numbers of Persian date strings through a precomputed NumPy lookup table
+"""
+
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from src import jalali
+
+logger = logging.getLogger(__name__)
+
+# Gregorian ordinal of the Unix epoch, used to build datetime64 values
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class JalaliOrdinalTable:
+    """Gregorian ordinal of every Jalali day in a range of years
+
+    Days are stored at ((year - first_year) * 12 + month - 1) * 31 + day - 1,
+    with -1 marking days that do not exist (e.g. 31 Mehr).
+    """
+
+    def __init__(self, first_year: int, last_year: int):
+        self.first_year = first_year
+        self.last_year = last_year
+
+        years = last_year - first_year + 1
+        table = np.full((years, 12, 31), -1, dtype=np.int64)
+        day_offsets = np.arange(31, dtype=np.int64)
+
+        for index, year in enumerate(range(first_year, last_year + 1)):
+            ordinal = jalali.jalali_to_ordinal(year, 1, 1)
+            for month in range(1, 13):
+                length = jalali.month_length(year, month)
+                table[index, month - 1, :length] = ordinal + day_offsets[:length]
+                ordinal += length
+
+        self._table = table.reshape(-1)
+
+    def lookup(self, years: np.ndarray, months: np.ndarray, days: np.ndarray) -> np.ndarray:
+        """Map Jalali dates to Gregorian ordinals
+
+        Args:
+            years: Jalali years
+            months: Jalali months (1-12)
+            days: Jalali days (1-31)
+
+        Returns:
+            Gregorian ordinals, -1 where the date is invalid or outside the table
+        """
+        in_range = (
+            (years >= self.first_year) & (years <= self.last_year) &
+            (months >= 1) & (months <= 12) & (days >= 1) & (days <= 31)
+        )
+        index = ((years - self.first_year) * 12 + months - 1) * 31 + days - 1
+        return np.where(in_range, self._table[np.where(in_range, index, 0)], -1)
+
+
+_tables: Dict[tuple[int, int], JalaliOrdinalTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_table(first_year: int, last_year: int) -> JalaliOrdinalTable:
+    """Get the shared lookup table for a year range, building it on first use"""
+    with _tables_lock:
+        table = _tables.get((first_year, last_year))
+        if table is None:
+            logger.debug(f"Building Jalali ordinal table for {first_year}-{last_year}")
+            table = _tables[(first_year, last_year)] = JalaliOrdinalTable(first_year, last_year)
+        return table
+
+
+class BatchConversion:
+    """Array-backed results of DateConverter.convert_many"""
+
+    def __init__(self, ordinals: np.ndarray, minutes: np.ndarray):
+        # Gregorian ordinal per input, -1 if it could not be converted
+        self.ordinals = ordinals
+        # Minutes after midnight per input, -1 if the string had no time
+        self.minutes = minutes
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Mask of inputs converted to a date and time
+
+        Like DateConverter.to_datetime, a missing or invalid time makes the
+        input unconvertible rather than midnight.
+        """
+        return (self.ordinals >= 0) & (self.minutes >= 0)
+
+    def to_datetime64(self) -> np.ndarray:
+        """Converted values as datetime64[m], NaT where conversion failed"""
+        minutes = (self.ordinals - EPOCH_ORDINAL) * 1440 + self.minutes
+        values = minutes.astype('datetime64[m]')
+        values[~self.valid] = np.datetime64('NaT')
+        return values
+
+    def datetime_at(self, index: int) -> Optional[datetime]:
+        """Converted value of one input as a datetime, None if conversion failed"""
+        ordinal = int(self.ordinals[index])
+        minutes = int(self.minutes[index])
+        if ordinal < 0 or minutes < 0:
+            return None
+        return datetime.fromordinal(ordinal) + timedelta(minutes=minutes)
+
+
+def _minutes_after_midnight(time_str: str) -> int:
+    """Minutes after midnight of an HH:MM string, -1 if missing or invalid"""
+    try:
+        hour, minute = map(int, time_str.split(':'))
+    except ValueError:
+        return -1
+    return hour * 60 + minute if 0 <= hour < 24 and 0 <= minute < 60 else -1
+
+
+def convert_many(components: Iterable[Dict[str, str]], first_year: int, last_year: int) -> BatchConversion:
+    """Convert extracted Persian date components in bulk
+
+    Args:
+        components: Dictionaries from DateConverter.extract_date_components
+        first_year: First Jalali year of the lookup table
+        last_year: Last Jalali year of the lookup table
+
+    Returns:
+        BatchConversion with one entry per input
+    """
+    years, months, days, minutes = [], [], [], []
+    for parts in components:
+        try:
+            year, month, day = int(parts['year']), int(parts['month']), int(parts['day'])
+        except (KeyError, ValueError):
+            # Falls outside the table and converts to -1
+            year, month, day = 0, 0, 0
+        years.append(year)
+        months.append(month)
+        days.append(day)
+
+        minutes.append(_minutes_after_midnight(parts.get('time', '')))
+
+    table = get_table(first_year, last_year)
+    ordinals = table.lookup(
+        np.array(years, dtype=np.int64),
+        np.array(months, dtype=np.int64),
+        np.array(days, dtype=np.int64)
+    )
+    return BatchConversion(ordinals, np.array(minutes, dtype=np.int64))
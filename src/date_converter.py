@@ -5,14 +5,63 @@ Handles Persian-to-Gregorian date conversion and Persian number normalization
 
 import re
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Hashable, Iterable, TYPE_CHECKING
 
-import jdatetime
+from src import jalali
+from src.config import config
+
+if TYPE_CHECKING:
+    from src.date_batch import BatchConversion
 
 logger = logging.getLogger(__name__)
 
 
+class _LRUCache:
+    """Thread-safe bounded memo table with least-recently-used eviction"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """Return (found, value) for a key and mark it as recently used"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond max_size"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def resize(self, max_size: int) -> None:
+        """Change the size limit and drop all entries and counters"""
+        with self._lock:
+            self.max_size = max_size
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'max_size': self.max_size}
+
+
 class DateConverter:
     """Handles conversion between Persian and Gregorian calendar systems"""
     
@@ -38,6 +87,47 @@ class DateConverter:
         'دی': '10', 'بهمن': '11', 'اسفند': '12'
     }
 
+    # Translation table for str.translate
+    DIGIT_TABLE = str.maketrans(PERSIAN_TO_ENGLISH_NUMBERS)
+
+    # Longest names first so 'اردیبهشت' wins over the 'دی' inside it
+    MONTH_PATTERN = re.compile('|'.join(sorted(PERSIAN_MONTHS, key=len, reverse=True)))
+
+    # Portal layout: optional weekday, day, month name, year and optional time,
+    # e.g. "پنج شنبه 24 مهر 1404 - 18:00" once digits are translated
+    DATE_PATTERN = re.compile(
+        r'^\D*?(\d{1,2})\s*(' + MONTH_PATTERN.pattern + r')\s*(\d{4})(?:\s*-\s*(\d{1,2}:\d{2}))?\s*$'
+    )
+    TIME_PATTERN = re.compile(r'\d{1,2}:\d{2}')
+    NUMBER_PATTERN = re.compile(r'\d+')
+
+    # Memoized results keyed on the raw date string and on
+    # (year, month, day, time); see configure_cache and cache_info
+    _string_cache = _LRUCache(config.date_cache_size)
+    _date_cache = _LRUCache(config.date_cache_size)
+
+    @staticmethod
+    def configure_cache(max_size: int) -> None:
+        """Set the size of the conversion caches, clearing them
+        
+        Args:
+            max_size: Maximum entries per cache; 0 disables memoization
+        """
+        DateConverter._string_cache.resize(max_size)
+        DateConverter._date_cache.resize(max_size)
+
+    @staticmethod
+    def cache_info() -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters of the conversion caches
+        
+        Returns:
+            Counters for the 'strings' and 'dates' caches
+        """
+        return {
+            'strings': DateConverter._string_cache.info(),
+            'dates': DateConverter._date_cache.info()
+        }
+
     @staticmethod
     def persian_to_english_numbers(text: str) -> str:
         """Convert Persian and Arabic numbers to English numbers
@@ -51,10 +141,7 @@ class DateConverter:
         if not text:
             return text
             
-        result = ''
-        for char in text:
-            result += DateConverter.PERSIAN_TO_ENGLISH_NUMBERS.get(char, char)
-        return result
+        return text.translate(DateConverter.DIGIT_TABLE)
 
     @staticmethod
     def extract_date_components(date_string: str) -> Dict[str, str]:
@@ -66,6 +153,16 @@ class DateConverter:
         Returns:
             Dictionary with extracted date components
         """
+        found, components = DateConverter._string_cache.lookup(date_string)
+        if not found:
+            components = DateConverter._parse_date_string(date_string)
+            DateConverter._string_cache.put(date_string, components)
+        # Callers get their own copy so the cached entry stays intact
+        return dict(components)
+
+    @staticmethod
+    def _parse_date_string(date_string: str) -> Dict[str, str]:
+        """Uncached implementation of extract_date_components"""
         if not date_string or not date_string.strip():
             logger.warning("Empty date string provided")
             return {
@@ -75,54 +172,18 @@ class DateConverter:
         
         try:
             # Convert Persian numbers to English for easier processing
-            cleaned = DateConverter.persian_to_english_numbers(date_string)
-            logger.debug(f"Cleaned date string: {cleaned}")
-            
-            # Extract time component (HH:MM format)
-            time_match = re.search(r'(\d{1,2}:\d{2})', cleaned)
-            time_str = time_match.group(1) if time_match else ""
-            
-            # Remove time to focus on date extraction
-            cleaned_without_time = re.sub(r'\d{1,2}:\d{2}', '', cleaned)
-            
-            # Extract all numbers from the date string
-            numbers = re.findall(r'\d+', cleaned_without_time)
-            
-            # Initialize components
-            year, month, day = "", "", ""
-            
-            # Year is typically 4 digits in Persian dates
-            for num in numbers:
-                if len(num) == 4:
-                    year = num
-                    break
-            
-            # Find month using Persian month names
-            month = DateConverter._extract_month_from_persian(date_string)
+            cleaned = date_string.translate(DateConverter.DIGIT_TABLE)
             
-            # Day is typically 1-2 digits and not the year or month
-            for num in numbers:
-                if len(num) <= 2 and num != year and num != month:
-                    day = num
-                    # Use first valid day found
-                    break
-            
-            # Validate that we have all required components
-            if not all([year, month, day]):
-                logger.warning(f"Incomplete date components extracted: {year}/{month}/{day}")
-            
-            full_date = f"{year}/{month}/{day}"
-            if time_str:
-                full_date += f" - {time_str}"
-                
-            return {
-                'year': year,
-                'month': month,
-                'day': day,
-                'time': time_str,
-                'full_date': full_date,
-                'original_string': date_string
-            }
+            # Fast path: the portal layout is matched in one go
+            match = DateConverter.DATE_PATTERN.match(cleaned)
+            if match:
+                day, month_name, year, time_str = match.groups()
+                return DateConverter._build_components(
+                    year, DateConverter.PERSIAN_MONTHS[month_name], day, time_str or "", date_string
+                )
+
+            logger.debug(f"Cleaned date string: {cleaned}")
+            return DateConverter._extract_date_components_general(cleaned, date_string)
             
         except Exception as e:
             logger.error(f"Error extracting date components from '{date_string}': {e}")
@@ -131,6 +192,69 @@ class DateConverter:
                 'full_date': '', 'original_string': date_string
             }
 
+    @staticmethod
+    def _build_components(year: str, month: str, day: str, time_str: str, date_string: str) -> Dict[str, str]:
+        """Build the components dictionary returned by extract_date_components"""
+        full_date = f"{year}/{month}/{day}"
+        if time_str:
+            full_date += f" - {time_str}"
+            
+        return {
+            'year': year,
+            'month': month,
+            'day': day,
+            'time': time_str,
+            'full_date': full_date,
+            'original_string': date_string
+        }
+
+    @staticmethod
+    def _extract_date_components_general(cleaned: str, date_string: str) -> Dict[str, str]:
+        """Extract date components from strings that do not follow the portal layout
+        
+        Args:
+            cleaned: Date string with English digits
+            date_string: Original Persian date string
+            
+        Returns:
+            Dictionary with extracted date components
+        """
+        # Extract time component (HH:MM format)
+        time_match = DateConverter.TIME_PATTERN.search(cleaned)
+        time_str = time_match.group(0) if time_match else ""
+        
+        # Remove time to focus on date extraction
+        cleaned_without_time = DateConverter.TIME_PATTERN.sub('', cleaned)
+        
+        # Extract all numbers from the date string
+        numbers = DateConverter.NUMBER_PATTERN.findall(cleaned_without_time)
+        
+        # Initialize components
+        year, month, day = "", "", ""
+        
+        # Year is typically 4 digits in Persian dates
+        for num in numbers:
+            if len(num) == 4:
+                year = num
+                break
+        
+        # Find month using Persian month names
+        month = DateConverter._extract_month_from_persian(date_string)
+        
+        # Day is typically 1-2 digits; the month is given by name, so a day
+        # equal to the month number (e.g. 5 Mordad) must not be skipped
+        for num in numbers:
+            if len(num) <= 2:
+                day = num
+                # Use first valid day found
+                break
+        
+        # Validate that we have all required components
+        if not all([year, month, day]):
+            logger.warning(f"Incomplete date components extracted: {year}/{month}/{day}")
+        
+        return DateConverter._build_components(year, month, day, time_str, date_string)
+
     @staticmethod
     def _extract_month_from_persian(date_string: str) -> str:
         """Extract month number from Persian month names
@@ -141,10 +265,8 @@ class DateConverter:
         Returns:
             Month number as string, empty string if not found
         """
-        for month_name, month_num in DateConverter.PERSIAN_MONTHS.items():
-            if month_name in date_string:
-                return month_num
-        return ""
+        match = DateConverter.MONTH_PATTERN.search(date_string)
+        return DateConverter.PERSIAN_MONTHS[match.group(0)] if match else ""
 
     @staticmethod
     def persian_to_georgian(date_dict: Dict[str, str]) -> Optional[Dict[str, Any]]:
@@ -157,6 +279,21 @@ class DateConverter:
         Returns:
             Dictionary with Gregorian date components or None if conversion fails
         """
+        try:
+            key = (date_dict['year'], date_dict['month'], date_dict['day'], date_dict.get('time', ''))
+        except (KeyError, TypeError):
+            # Invalid input, let the conversion report it
+            return DateConverter._convert_persian_components(date_dict)
+
+        found, result = DateConverter._date_cache.lookup(key)
+        if not found:
+            result = DateConverter._convert_persian_components(date_dict)
+            DateConverter._date_cache.put(key, result)
+        return dict(result) if result is not None else None
+
+    @staticmethod
+    def _convert_persian_components(date_dict: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Uncached implementation of persian_to_georgian"""
         try:
             # Validate input
             if not all(key in date_dict for key in ['year', 'month', 'day']):
@@ -181,34 +318,31 @@ class DateConverter:
             logger.debug(f"Converting Persian date: {year}/{month}/{day} {time_str}")
             
             # Convert Persian date to Gregorian
-            persian_date = jdatetime.date(year, month, day)
-            georgian_date = persian_date.togregorian()
+            g_year, g_month, g_day = jalali.jalali_to_gregorian(year, month, day)
+            date_part = f"{g_year:04d}-{g_month:02d}-{g_day:02d}"
             
             # Handle time component if present
             if time_str:
                 try:
                     hour, minute = map(int, time_str.split(':'))
-                    georgian_datetime = datetime(
-                        georgian_date.year, georgian_date.month, georgian_date.day,
-                        hour, minute
-                    )
-                    full_date = georgian_datetime.strftime('%Y-%m-%d %H:%M')
+                    georgian_datetime = datetime(g_year, g_month, g_day, hour, minute)
+                    full_date = f"{date_part} {hour:02d}:{minute:02d}"
                 except ValueError as e:
                     logger.warning(f"Invalid time format '{time_str}': {e}")
                     georgian_datetime = None
-                    full_date = georgian_date.strftime('%Y-%m-%d')
+                    full_date = date_part
             else:
                 georgian_datetime = None
-                full_date = georgian_date.strftime('%Y-%m-%d')
+                full_date = date_part
             
             result = {
-                'year': str(georgian_date.year),
-                'month': str(georgian_date.month).zfill(2),
-                'day': str(georgian_date.day).zfill(2),
+                'year': str(g_year),
+                'month': f"{g_month:02d}",
+                'day': f"{g_day:02d}",
                 'time': time_str,
                 'date_object': georgian_datetime,
                 'full_date': full_date,
-                'display': f"{georgian_date.year}/{georgian_date.month:02d}/{georgian_date.day:02d}"
+                'display': f"{g_year}/{g_month:02d}/{g_day:02d}"
             }
             
             if time_str:
@@ -245,6 +379,44 @@ class DateConverter:
             logger.error(f"Failed to convert Persian date '{persian_date}': {e}")
             return None
 
+    @staticmethod
+    def to_datetime(persian_date: str) -> Optional[datetime]:
+        """Convert a Persian date string with time directly to a datetime
+        
+        Args:
+            persian_date: Persian date string
+            
+        Returns:
+            Gregorian datetime, or None if the string has no valid date and time
+        """
+        gregorian = DateConverter.persian_to_georgian(DateConverter.extract_date_components(persian_date))
+        return gregorian['date_object'] if gregorian else None
+
+    @staticmethod
+    def convert_many(date_strings: Iterable[str], first_year: Optional[int] = None,
+                     last_year: Optional[int] = None) -> "BatchConversion":
+        """Convert many Persian date strings in one call
+        
+        Dates are looked up in a precomputed NumPy table instead of building
+        a calendar object per string, which suits bulk archive backfills.
+        
+        Args:
+            date_strings: Persian date strings
+            first_year: First Jalali year of the lookup table (config.date_table_first_year)
+            last_year: Last Jalali year of the lookup table (config.date_table_last_year)
+            
+        Returns:
+            BatchConversion with Gregorian ordinals and minutes per input
+        """
+        # NumPy is only needed for batch conversion, keep it out of startup
+        from src.date_batch import convert_many
+
+        return convert_many(
+            (DateConverter.extract_date_components(date_string) for date_string in date_strings),
+            first_year or config.date_table_first_year,
+            last_year or config.date_table_last_year
+        )
+
 
 def main():
     """Test function for date conversion"""
@@ -0,0 +1,125 @@
+"""
+Chrome Driver Pool
+Keeps several logged-in Chrome drivers warm for loading course pages in parallel
+"""
+
+import queue
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, TypeVar
+
+from selenium.common.exceptions import WebDriverException
+
+from src.config import config
+from src.rate_limiter import governed_get
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Cookie fields accepted by WebDriver's add_cookie
+COOKIE_FIELDS = ('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry', 'sameSite')
+
+
+class DriverPool:
+    """Hands out Chrome drivers that share the session cookies of a logged-in driver"""
+
+    def __init__(self, driver_factory: Callable[[], Any], size: int):
+        """
+        Args:
+            driver_factory: Callable returning a new, not yet logged-in driver
+            size: Number of drivers in the pool
+        """
+        self.driver_factory = driver_factory
+        self.size = size
+        self._cookies: List[Dict[str, Any]] = []
+        self._drivers = []
+        self._idle: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+
+    def start(self, source_driver) -> None:
+        """Create the pool drivers and clone the session of source_driver into them
+
+        Args:
+            source_driver: Driver that has already logged in
+        """
+        logger.info(f"Starting driver pool with {self.size} drivers...")
+        self._cookies = [
+            {key: cookie[key] for key in COOKIE_FIELDS if key in cookie}
+            for cookie in source_driver.get_cookies()
+        ]
+
+        # Chrome startup dominates, so launch the drivers side by side
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            drivers = list(executor.map(lambda _: self._create_driver(), range(self.size)))
+
+        for driver in drivers:
+            self._idle.put(driver)
+        logger.info("Driver pool ready")
+
+    def _create_driver(self):
+        """Create a driver carrying the shared session cookies"""
+        driver = self.driver_factory()
+        with self._lock:
+            self._drivers.append(driver)
+
+        # Cookies can only be added for the domain currently loaded
+        governed_get(driver, config.base_url)
+        for cookie in self._cookies:
+            driver.add_cookie(cookie)
+        return driver
+
+    def _is_healthy(self, driver) -> bool:
+        """Check that a driver still responds to commands"""
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _replace(self, driver):
+        """Quit a broken driver and create a logged-in replacement"""
+        logger.warning("Replacing unresponsive driver in pool")
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Could not quit broken driver: {e}")
+        return self._create_driver()
+
+    def run(self, task: Callable[[Any], T]) -> T:
+        """Run a task on an idle driver, retrying once on a fresh driver if it crashed
+
+        Args:
+            task: Callable receiving the driver to use
+
+        Returns:
+            Result of the task
+        """
+        driver = self._idle.get()
+        try:
+            if not self._is_healthy(driver):
+                driver = self._replace(driver)
+            try:
+                return task(driver)
+            except Exception:
+                if self._is_healthy(driver):
+                    raise
+                driver = self._replace(driver)
+                return task(driver)
+        finally:
+            self._idle.put(driver)
+
+    def close(self) -> None:
+        """Quit every driver owned by the pool"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Could not quit pool driver: {e}")
+        self._idle = queue.Queue()
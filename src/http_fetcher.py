@@ -0,0 +1,142 @@
+"""
+HTTP Fetch Engine
+Loads portal pages over plain HTTP using the cookies of an authenticated browser session
+"""
+
+import logging
+from typing import List, Dict, Any, Optional, NamedTuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.rate_limiter import RequestGovernor, request_governor
+
+logger = logging.getLogger(__name__)
+
+# Path the portal redirects to when the session is not authenticated
+LOGIN_PATH = "/Identity/Account/Login"
+
+
+class SessionExpiredError(Exception):
+    """Raised when the portal redirects a request back to the login page"""
+
+
+class FetchResult(NamedTuple):
+    """Outcome of a conditional page request"""
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    # True when the portal answered 304 and text is empty
+    not_modified: bool
+
+
+class HttpFetcher:
+    """Fetches portal pages through a pooled requests.Session"""
+
+    def __init__(self, pool_size: int = 10, timeout: float = 15, governor: Optional[RequestGovernor] = None):
+        self.timeout = timeout
+        self.governor = governor or request_governor
+        self.session = requests.Session()
+
+        # Reuse keep-alive connections. No retries at the adapter level: they
+        # would bypass the governor, so failed requests are retried by the
+        # caller, paced like any other request (see Scraper._fetch_with_retries)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def from_driver(cls, driver, pool_size: int = 10, timeout: float = 15) -> "HttpFetcher":
+        """Create a fetcher that shares the authenticated session of a WebDriver
+
+        Args:
+            driver: Logged-in WebDriver instance
+            pool_size: Maximum number of pooled connections per host
+            timeout: Request timeout in seconds
+
+        Returns:
+            HttpFetcher carrying the driver's cookies and user agent
+        """
+        fetcher = cls(pool_size=pool_size, timeout=timeout)
+        fetcher.load_cookies(driver.get_cookies())
+
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent")
+            if user_agent:
+                fetcher.session.headers['User-Agent'] = user_agent
+        except Exception as e:
+            logger.debug(f"Could not read browser user agent: {e}")
+
+        return fetcher
+
+    def load_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """Load WebDriver-style cookie dictionaries into the session
+
+        Args:
+            cookies: Cookies as returned by driver.get_cookies()
+        """
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+        logger.debug(f"Loaded {len(cookies)} cookies into HTTP session")
+
+    def fetch(self, url: str) -> str:
+        """Fetch a portal page as HTML
+
+        Args:
+            url: Absolute page URL
+
+        Returns:
+            Page HTML
+
+        Raises:
+            SessionExpiredError: If the portal redirected to the login page
+            requests.HTTPError: If the portal returned an error status
+        """
+        return self.fetch_conditional(url).text
+
+    def fetch_conditional(self, url: str, etag: Optional[str] = None,
+                          last_modified: Optional[str] = None) -> FetchResult:
+        """Fetch a portal page unless it is unchanged since the given validators
+
+        Args:
+            url: Absolute page URL
+            etag: ETag from a previous response, sent as If-None-Match
+            last_modified: Last-Modified from a previous response, sent as If-Modified-Since
+
+        Returns:
+            FetchResult with the page HTML and its validators
+
+        Raises:
+            SessionExpiredError: If the portal redirected to the login page
+            requests.HTTPError: If the portal returned an error status
+        """
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        logger.debug(f"Fetching over HTTP: {url}")
+        with self.governor.request(url) as slot:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            slot.record(response.status_code, response.headers.get('Retry-After'))
+        response.raise_for_status()
+
+        if LOGIN_PATH in response.url:
+            raise SessionExpiredError(f"Redirected to login page while fetching {url}")
+
+        return FetchResult(
+            text=response.text if response.status_code != 304 else "",
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            not_modified=response.status_code == 304
+        )
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
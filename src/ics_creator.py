@@ -4,12 +4,21 @@ Creates iCalendar (.ics) files for university class schedules
 """
 
 import os
+import json
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from src.config import config
+from src.ics_diff import IncrementalIcsWriter, PreviousEvent, read_events
+from src.ics_writer import IcsWriter
+from src.models import Course
 
 logger = logging.getLogger(__name__)
 
+# Appended to the calendar path for the file keeping the last SEQUENCE of
+# cancelled events that were dropped from the calendar
+RETIRED_SEQUENCES_SUFFIX = ".sequences.json"
+
 
 class IcsCreator:
     """Handles creation of iCalendar files from class schedule data"""
@@ -27,35 +36,48 @@ class IcsCreator:
             logger.error(f"Failed to create output directory {self.output_dir}: {e}")
             raise
     
-    def create_ics_file(self, results: List[Dict[str, Any]], filename: str = 'class_schedule.ics') -> str:
+    def create_ics_file(self, results: Iterable[Course], filename: str = 'class_schedule.ics',
+                        incremental: Optional[bool] = None) -> str:
         """Create .ics file for importing into calendar applications
         
         Args:
-            results: List of class information with sessions
+            results: Courses with sessions, consumed lazily
             filename: Output filename for the ICS file
+            incremental: Diff against the existing file, defaults to config.ics_incremental
             
         Returns:
             Path to the created ICS file
         """
         filepath = os.path.join(self.output_dir, filename)
+        if incremental is None:
+            incremental = config.ics_incremental
         
         try:
             logger.info(f"Creating ICS file: {filepath}")
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # Write calendar header
-                f.write("BEGIN:VCALENDAR\n")
-                f.write("VERSION:2.0\n")
-                f.write("PRODID:-//University Class Schedule//FA\n")
-                f.write("CALSCALE:GREGORIAN\n")
-                f.write("METHOD:PUBLISH\n")
-                
-                # Write events for each class session
-                class_counter, session_counter = self._write_events(f, results)
-                
-                # Write calendar footer
-                f.write("END:VCALENDAR\n")
+            previous = self._read_previous_events(filepath) if incremental else None
+            retired = self._read_retired_sequences(filepath) if previous is not None else None
+            
+            # Write next to the old file and swap, so it can be diffed while writing
+            temp_path = filepath + ".tmp"
+            try:
+                with open(temp_path, 'wb') as f:
+                    if previous is None:
+                        writer = IcsWriter(f, recurrence=config.ics_recurrence)
+                    else:
+                        writer = IncrementalIcsWriter(f, previous, recurrence=config.ics_recurrence,
+                                                      retired=retired)
+                    class_counter, session_counter = writer.write_calendar(results)
+                os.replace(temp_path, filepath)
+            except BaseException:
+                # Leave no half-written calendar behind
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
             
+            if previous is not None:
+                self._write_retired_sequences(filepath, writer.retired)
+                logger.info("Calendar changes: " + ", ".join(f"{count} {kind}" for kind, count in writer.stats.items()))
             self._log_creation_summary(class_counter, session_counter, filepath)
             return filepath
             
@@ -63,111 +85,41 @@ class IcsCreator:
             logger.error(f"Failed to create ICS file {filepath}: {e}")
             raise
     
-    def _write_events(self, file_handle, results: List[Dict[str, Any]]) -> tuple[int, int]:
-        """Write VEVENT entries for all class sessions
-        
-        Args:
-            file_handle: Open file handle for writing
-            results: Class schedule data
-            
-        Returns:
-            Tuple of (class_count, session_count)
-        """
-        class_counter = 0
-        session_counter = 0
-        
-        for class_info in results:
-            class_counter += 1
-            class_name = self._sanitize_text(class_info['class_name'])
-            
-            for session in class_info['sessions']:
-                session_counter += 1
-                self._write_single_event(file_handle, class_name, session)
-        
-        return class_counter, session_counter
-    
-    def _write_single_event(self, file_handle, class_name: str, session: Dict[str, Any]) -> None:
-        """Write a single VEVENT entry
-        
-        Args:
-            file_handle: Open file handle for writing
-            class_name: Name of the class
-            session: Session data with start/end times
-        """
+    def _read_previous_events(self, filepath: str) -> Optional[Dict[str, PreviousEvent]]:
+        """Read the events of the previous calendar, None if there is none"""
         try:
-            # Validate session data
-            if not self._validate_session_data(session):
-                logger.warning(f"Skipping invalid session for {class_name}")
-                return
-            
-            start_dt = session['start_gregorian']['date_object']
-            end_dt = session['end_gregorian']['date_object']
-            uid = session.get('uid', f"{class_name}_{start_dt.strftime('%Y%m%d%H%M')}")
-            
-            # Write event
-            file_handle.write("BEGIN:VEVENT\n")
-            file_handle.write(f"UID:{uid}\n")
-            file_handle.write(f"SUMMARY:{class_name}\n")
-            file_handle.write(f"DTSTART:{start_dt.strftime('%Y%m%dT%H%M%S')}\n")
-            file_handle.write(f"DTEND:{end_dt.strftime('%Y%m%dT%H%M%S')}\n")
-            file_handle.write(f"DTSTAMP:{datetime.now().strftime('%Y%m%dT%H%M%SZ')}\n")
-            file_handle.write("SEQUENCE:0\n")
-            file_handle.write("TRANSP:OPAQUE\n")
-            file_handle.write("END:VEVENT\n")
-            
+            with open(filepath, 'rb') as f:
+                return read_events(f)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"Failed to write event for {class_name}: {e}")
+            logger.warning(f"Ignoring unreadable previous calendar {filepath}: {e}")
+            return None
     
-    def _validate_session_data(self, session: Dict[str, Any]) -> bool:
-        """Validate that session has required data for ICS creation
-        
-        Args:
-            session: Session data to validate
-            
-        Returns:
-            True if valid, False otherwise
-        """
-        required_keys = ['start_gregorian', 'end_gregorian']
-        
-        # Check required keys exist
-        if not all(key in session for key in required_keys):
-            return False
-        
-        # Check date objects exist and are valid
-        start_data = session['start_gregorian']
-        end_data = session['end_gregorian']
-        
-        if not start_data.get('date_object') or not end_data.get('date_object'):
-            return False
-        
-        # Check end is after start
-        if start_data['date_object'] >= end_data['date_object']:
-            logger.warning(f"Invalid time range: end before start")
-            return False
-        
-        return True
+    def _read_retired_sequences(self, filepath: str) -> Dict[str, int]:
+        """Read the last SEQUENCE of events dropped from the calendar by UID"""
+        try:
+            with open(filepath + RETIRED_SEQUENCES_SUFFIX, 'r', encoding='utf-8') as f:
+                return {uid: int(sequence) for uid, sequence in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable sequences of dropped events: {e}")
+            return {}
     
-    def _sanitize_text(self, text: str) -> str:
-        """Sanitize text for ICS format
-        
-        Args:
-            text: Text to sanitize
-            
-        Returns:
-            Sanitized text safe for ICS format
-        """
-        if not text:
-            return ""
-        
-        # Remove or replace characters that might break ICS format
-        sanitized = text.replace('\n', ' ').replace('\r', ' ')
-        sanitized = sanitized.replace(';', ',').replace('\\', '/')
-        
-        # Limit length for calendar compatibility
-        if len(sanitized) > 100:
-            sanitized = sanitized[:97] + "..."
-            
-        return sanitized
+    def _write_retired_sequences(self, filepath: str, retired: Dict[str, int]) -> None:
+        """Replace the file of dropped events' sequences, removing it when there are none"""
+        path = filepath + RETIRED_SEQUENCES_SUFFIX
+        try:
+            if not retired:
+                if os.path.exists(path):
+                    os.remove(path)
+                return
+            with open(path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(retired, f, sort_keys=True)
+            os.replace(path + ".tmp", path)
+        except Exception as e:
+            logger.warning(f"Could not save sequences of dropped events: {e}")
     
     def _log_creation_summary(self, class_count: int, session_count: int, filepath: str) -> None:
         """Log summary of ICS file creation
@@ -186,18 +138,18 @@ class IcsCreator:
         print(f"📅 Sessions: {session_count}")
         print(f"✅ Ready to import into your calendar application!")
     
-    def print_debug_info(self, results: List[Dict[str, Any]]) -> None:
+    def print_debug_info(self, results: List[Course]) -> None:
         """Print detailed information about extracted classes and sessions
         
         Args:
-            results: List of class information with sessions
+            results: List of courses with sessions
         """
         if not results:
             print("❌ No data to display")
             return
         
         total_classes = len(results)
-        total_sessions = sum(len(class_info['sessions']) for class_info in results)
+        total_sessions = sum(len(course.sessions) for course in results)
         
         print("\n" + "=" * 80)
         print("📊 EXTRACTED CLASS SCHEDULE SUMMARY")
@@ -206,17 +158,17 @@ class IcsCreator:
         print(f"📅 Total Sessions: {total_sessions}")
         print("=" * 80)
         
-        for class_index, class_info in enumerate(results, 1):
-            class_name = class_info['class_name']
-            session_count = len(class_info['sessions'])
+        for class_index, course in enumerate(results, 1):
+            class_name = course.name
+            session_count = len(course.sessions)
             
             print(f"\n📖 Class {class_index}/{total_classes}: {class_name}")
             print(f"   📋 Sessions: {session_count}")
             print("   " + "─" * 50)
             
-            for session_index, session in enumerate(class_info['sessions'], 1):
-                start_display = session['start_gregorian']['display']
-                end_display = session['end_gregorian']['display']
+            for session_index, session in enumerate(course.sessions, 1):
+                start_display = session.start_display
+                end_display = session.end_display
                 
                 print(f"   🕒 Session {session_index}:")
                 print(f"      🟢 Start: {start_display}")
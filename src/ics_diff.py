@@ -0,0 +1,142 @@
+"""
+Incremental ICS Regeneration
+Diffs a new schedule against the previous calendar file so only changed events are revised
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import BinaryIO, Dict, List, NamedTuple, Optional
+
+from src.ics_writer import CRLF, IcsWriter
+
+logger = logging.getLogger(__name__)
+
+# Properties that change with every revision and are left out of content hashes
+VOLATILE_PROPERTIES = ('DTSTAMP', 'SEQUENCE')
+CANCELLED_STATUS = "STATUS:CANCELLED"
+
+
+class PreviousEvent(NamedTuple):
+    """A VEVENT of the previous calendar"""
+    content_hash: str
+    sequence: int
+    properties: List[str]
+    raw: bytes
+
+
+def content_hash(properties: List[str]) -> str:
+    """Hash of an event's unfolded content lines, excluding volatile properties"""
+    return hashlib.sha256("\n".join(properties).encode('utf-8')).hexdigest()
+
+
+def _property_name(line: str) -> str:
+    """Name of a content line's property, without parameters"""
+    return line.split(':', 1)[0].split(';', 1)[0].upper()
+
+
+def read_events(stream: BinaryIO) -> Dict[str, PreviousEvent]:
+    """Read the events of a calendar written by IcsWriter
+
+    Args:
+        stream: Calendar opened in binary mode
+
+    Returns:
+        Events keyed by UID, with their raw lines normalized to CRLF
+    """
+    events: Dict[str, PreviousEvent] = {}
+    raw_lines: Optional[List[bytes]] = None
+    unfolded: List[str] = []
+
+    for physical in stream:
+        physical = physical.rstrip(b"\r\n")
+        if raw_lines is None:
+            if physical == b"BEGIN:VEVENT":
+                raw_lines, unfolded = [physical], []
+            continue
+
+        raw_lines.append(physical)
+        if physical[:1] in (b" ", b"\t") and unfolded:
+            # Continuation of a folded line; the fold never splits UTF-8 sequences
+            unfolded[-1] += physical[1:].decode('utf-8')
+        elif physical == b"END:VEVENT":
+            event = _build_event(unfolded, raw_lines)
+            if event is not None:
+                events[event[0]] = event[1]
+            raw_lines = None
+        else:
+            unfolded.append(physical.decode('utf-8'))
+
+    return events
+
+
+def _build_event(unfolded: List[str], raw_lines: List[bytes]) -> Optional[tuple[str, PreviousEvent]]:
+    """Turn the lines of one VEVENT into a (uid, PreviousEvent) pair"""
+    uid = None
+    sequence = 0
+    properties = []
+    for line in unfolded:
+        name = _property_name(line)
+        if name == 'SEQUENCE':
+            try:
+                sequence = int(line.split(':', 1)[1])
+            except (IndexError, ValueError):
+                sequence = 0
+        elif name not in VOLATILE_PROPERTIES:
+            properties.append(line)
+            if name == 'UID':
+                uid = line.split(':', 1)[1]
+
+    if uid is None:
+        return None
+    raw = b"".join(line + CRLF for line in raw_lines)
+    return uid, PreviousEvent(content_hash(properties), sequence, properties, raw)
+
+
+class IncrementalIcsWriter(IcsWriter):
+    """IcsWriter that keeps unchanged events of the previous calendar byte-identical
+
+    Changed events get their SEQUENCE bumped and events missing from the new
+    schedule are published as cancelled once, so clients only resync what
+    changed and the file does not keep growing with cancelled events.
+    
+    The last SEQUENCE of each dropped cancellation is kept in retired, so an
+    event that comes back later outranks the cancellation clients still hold.
+    """
+
+    def __init__(self, stream, previous: Dict[str, PreviousEvent],
+                 dtstamp: Optional[datetime] = None, recurrence: bool = False,
+                 retired: Optional[Dict[str, int]] = None):
+        super().__init__(stream, dtstamp, recurrence)
+        self.previous = previous
+        self.retired = dict(retired or {})
+        self._seen = set()
+        self.stats = {'unchanged': 0, 'changed': 0, 'added': 0, 'cancelled': 0}
+
+    def write_event(self, uid: str, properties: List[str], sequence: int = 0) -> None:
+        self._seen.add(uid)
+        previous = self.previous.get(uid)
+        if previous is None:
+            self.stats['added'] += 1
+            if uid in self.retired:
+                sequence = max(sequence, self.retired.pop(uid) + 1)
+            super().write_event(uid, properties, sequence)
+        elif previous.content_hash == content_hash(properties):
+            self.stats['unchanged'] += 1
+            self.write_raw(previous.raw)
+        else:
+            self.stats['changed'] += 1
+            super().write_event(uid, properties, max(sequence, previous.sequence + 1))
+
+    def finish_events(self) -> None:
+        """Publish events of the previous calendar that are gone as cancelled"""
+        for uid, previous in self.previous.items():
+            if uid in self._seen:
+                continue
+            if CANCELLED_STATUS in previous.properties:
+                # Clients have seen the cancellation in an earlier run
+                logger.debug(f"Dropping event cancelled in an earlier run: {uid}")
+                self.retired[uid] = previous.sequence
+                continue
+            self.stats['cancelled'] += 1
+            super().write_event(uid, [*previous.properties, CANCELLED_STATUS], previous.sequence + 1)
@@ -0,0 +1,231 @@
+"""
+Streaming ICS Serializer
+Writes iCalendar data event by event with RFC 5545 line folding
+"""
+
+import io
+import logging
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+from src.models import Course, Session
+from src.recurrence import WeeklySeries, group_weekly
+
+logger = logging.getLogger(__name__)
+
+# Content lines end with CRLF and are folded at 75 octets (RFC 5545 section 3.1)
+CRLF = b"\r\n"
+FOLD_SEPARATOR = b"\r\n "
+MAX_LINE_OCTETS = 75
+
+CALENDAR_HEADER = (
+    "BEGIN:VCALENDAR",
+    "VERSION:2.0",
+    "PRODID:-//University Class Schedule//FA",
+    "CALSCALE:GREGORIAN",
+    "METHOD:PUBLISH",
+)
+CALENDAR_FOOTER = ("END:VCALENDAR",)
+
+# Longest summary kept, for calendar compatibility
+MAX_SUMMARY_LENGTH = 100
+
+
+def fold_line(line: str) -> bytes:
+    """Encode a content line, folding it into chunks of at most 75 octets
+
+    Continuation chunks start with a space, which counts toward their
+    length, and UTF-8 sequences are never split across chunks.
+
+    Args:
+        line: Content line without line ending
+
+    Returns:
+        UTF-8 encoded line terminated with CRLF
+    """
+    data = line.encode('utf-8')
+    if len(data) <= MAX_LINE_OCTETS:
+        return data + CRLF
+
+    chunks = []
+    start = 0
+    limit = MAX_LINE_OCTETS
+    while len(data) - start > limit:
+        end = start + limit
+        # Step back over UTF-8 continuation bytes
+        while data[end] & 0xC0 == 0x80:
+            end -= 1
+        chunks.append(data[start:end])
+        start = end
+        limit = MAX_LINE_OCTETS - 1
+    chunks.append(data[start:])
+    return FOLD_SEPARATOR.join(chunks) + CRLF
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a floating local datetime as an ICS DATE-TIME"""
+    return f"{value.year:04d}{value.month:02d}{value.day:02d}T{value.hour:02d}{value.minute:02d}{value.second:02d}"
+
+
+def format_utc(value: datetime) -> str:
+    """Format an aware datetime as an ICS UTC DATE-TIME"""
+    return format_datetime(value.astimezone(timezone.utc)) + "Z"
+
+
+def sanitize_text(text: str) -> str:
+    """Sanitize text for ICS format
+
+    Args:
+        text: Text to sanitize
+
+    Returns:
+        Sanitized text safe for ICS format
+    """
+    if not text:
+        return ""
+
+    # Remove or replace characters that might break ICS format
+    sanitized = text.replace('\n', ' ').replace('\r', ' ')
+    sanitized = sanitized.replace(';', ',').replace('\\', '/')
+
+    # Limit length for calendar compatibility
+    if len(sanitized) > MAX_SUMMARY_LENGTH:
+        sanitized = sanitized[:MAX_SUMMARY_LENGTH - 3] + "..."
+
+    return sanitized
+
+
+class IcsWriter:
+    """Serializes courses to a text or binary stream one event at a time
+
+    Nothing but the current course is held in memory, so calendars of any
+    size can be streamed from a generator of courses. With recurrence
+    enabled, weekly sessions of a course are written as one RRULE event.
+    """
+
+    def __init__(self, stream, dtstamp: Optional[datetime] = None, recurrence: bool = False):
+        self.stream = stream
+        self._text_mode = isinstance(stream, io.TextIOBase)
+        if self._text_mode and hasattr(stream, 'buffer'):
+            # Text files translate "\n" on write ("\r\n" becomes "\r\r\n" on
+            # Windows unless opened with newline=''), so write the file's bytes
+            stream.flush()
+            self.stream = stream.buffer
+            self._text_mode = False
+        # Every event of a calendar shares the time it was generated
+        self.dtstamp = format_utc(dtstamp or datetime.now(timezone.utc))
+        self.recurrence = recurrence
+
+    def write_calendar(self, courses: Iterable[Course]) -> tuple[int, int]:
+        """Write a complete calendar
+
+        Args:
+            courses: Courses with sessions, consumed lazily
+
+        Returns:
+            Tuple of (class_count, session_count)
+        """
+        self.write_lines(CALENDAR_HEADER)
+
+        class_counter = 0
+        session_counter = 0
+        for course in courses:
+            class_counter += 1
+            summary = sanitize_text(course.name)
+            if self.recurrence:
+                session_counter += self._write_grouped(summary, course.sessions)
+                continue
+            for session in course.sessions:
+                if self.write_session(summary, session):
+                    session_counter += 1
+
+        self.finish_events()
+        self.write_lines(CALENDAR_FOOTER)
+        return class_counter, session_counter
+
+    def _write_grouped(self, summary: str, sessions: Iterable[Session]) -> int:
+        """Write a course's sessions as weekly series and single events
+
+        Returns:
+            Number of sessions written
+        """
+        valid = [session for session in sessions if self._is_valid(summary, session)]
+        for item in group_weekly(valid):
+            if isinstance(item, WeeklySeries):
+                self.write_event(item.uid, self.series_properties(summary, item))
+            else:
+                self.write_event(item.uid, self.event_properties(summary, item))
+        return len(valid)
+
+    def write_session(self, summary: str, session: Session) -> bool:
+        """Write the VEVENT of a single session
+
+        Args:
+            summary: Sanitized event summary
+            session: Session to write
+
+        Returns:
+            True if written, False if the session was skipped
+        """
+        if not self._is_valid(summary, session):
+            return False
+
+        self.write_event(session.uid, self.event_properties(summary, session))
+        return True
+
+    @staticmethod
+    def _is_valid(summary: str, session: Session) -> bool:
+        """Check that a session ends after it starts"""
+        if session.start >= session.end:
+            logger.warning(f"Skipping session {session.uid} of {summary}: end before start")
+            return False
+        return True
+
+    def event_properties(self, summary: str, session: Session) -> List[str]:
+        """Content lines describing a session, without the per-revision DTSTAMP and SEQUENCE"""
+        return [
+            f"UID:{session.uid}",
+            f"SUMMARY:{summary}",
+            f"DTSTART:{format_datetime(session.start)}",
+            f"DTEND:{format_datetime(session.end)}",
+            "TRANSP:OPAQUE",
+        ]
+
+    def series_properties(self, summary: str, series: WeeklySeries) -> List[str]:
+        """Content lines describing a weekly series, without DTSTAMP and SEQUENCE"""
+        properties = [
+            f"UID:{series.uid}",
+            f"SUMMARY:{summary}",
+            f"DTSTART:{format_datetime(series.start)}",
+            f"DTEND:{format_datetime(series.end)}",
+            f"RRULE:FREQ=WEEKLY;COUNT={series.count}",
+        ]
+        if series.exdates:
+            properties.append("EXDATE:" + ",".join(format_datetime(exdate) for exdate in series.exdates))
+        properties.append("TRANSP:OPAQUE")
+        return properties
+
+    def write_event(self, uid: str, properties: List[str], sequence: int = 0) -> None:
+        """Write a VEVENT from its properties
+
+        Args:
+            uid: Event UID, also the first of the properties
+            properties: Content lines from event_properties
+            sequence: Revision number of the event
+        """
+        self.write_lines(["BEGIN:VEVENT", *properties,
+                          f"DTSTAMP:{self.dtstamp}", f"SEQUENCE:{sequence}", "END:VEVENT"])
+
+    def finish_events(self) -> None:
+        """Hook run after the last event, before the calendar footer"""
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        """Fold and write content lines with a single write call"""
+        self.write_raw(b"".join(fold_line(line) for line in lines))
+
+    def write_raw(self, data: bytes) -> None:
+        """Write already serialized content to the stream"""
+        if self._text_mode:
+            self.stream.write(data.decode('utf-8'))
+        else:
+            self.stream.write(data)
@@ -0,0 +1,162 @@
+"""
+Jalali Calendar Arithmetic
+Integer-only conversion between the Jalali (Persian) and Gregorian calendars through Julian Day Numbers
+"""
+
+# Jalali years where the 33-year leap cycle pattern shifts (Borkowski's algorithm,
+# as used by jalaali-js and jdatetime); valid years lie between the first and last
+BREAKS = (
+    -61, 9, 38, 199, 426, 686, 756, 818, 1111, 1181, 1210,
+    1635, 2060, 2097, 2192, 2262, 2324, 2394, 2456, 3178
+)
+
+# Julian Day Number of 0001-01-01 is ORDINAL_OFFSET + 1
+ORDINAL_OFFSET = 1721425
+
+
+def _div(a: int, b: int) -> int:
+    """Integer division truncating toward zero"""
+    return int(a / b) if (a < 0) != (b < 0) else a // b
+
+
+def _mod(a: int, b: int) -> int:
+    """Remainder matching _div"""
+    return a - _div(a, b) * b
+
+
+def _jal_cal(jy: int) -> tuple[int, int, int]:
+    """Leap cycle position of a Jalali year
+
+    Args:
+        jy: Jalali year
+
+    Returns:
+        Tuple of (years since last leap year, Gregorian year of Farvardin 1,
+        March day of Farvardin 1)
+    """
+    if jy < BREAKS[0] or jy >= BREAKS[-1]:
+        raise ValueError(f"Jalali year {jy} is out of the supported range")
+
+    gy = jy + 621
+    leap_j = -14
+    jp = BREAKS[0]
+    jump = 0
+    for jm in BREAKS[1:]:
+        jump = jm - jp
+        if jy < jm:
+            break
+        leap_j += _div(jump, 33) * 8 + _div(_mod(jump, 33), 4)
+        jp = jm
+
+    n = jy - jp
+    leap_j += _div(n, 33) * 8 + _div(_mod(n, 33) + 3, 4)
+    if _mod(jump, 33) == 4 and jump - n == 4:
+        leap_j += 1
+
+    leap_g = _div(gy, 4) - _div((_div(gy, 100) + 1) * 3, 4) - 150
+    march = 20 + leap_j - leap_g
+
+    if jump - n < 6:
+        n = n - jump + _div(jump + 4, 33) * 33
+    leap = _mod(_mod(n + 1, 33) - 1, 4)
+    if leap == -1:
+        leap = 4
+
+    return leap, gy, march
+
+
+def is_leap_year(jy: int) -> bool:
+    """Check whether a Jalali year has 30 days in Esfand"""
+    return _jal_cal(jy)[0] == 0
+
+
+def month_length(jy: int, jm: int) -> int:
+    """Number of days in a Jalali month"""
+    if jm <= 6:
+        return 31
+    if jm <= 11:
+        return 30
+    return 30 if is_leap_year(jy) else 29
+
+
+def is_valid_jalali(jy: int, jm: int, jd: int) -> bool:
+    """Check whether a Jalali date exists"""
+    try:
+        return 1 <= jm <= 12 and 1 <= jd <= month_length(jy, jm)
+    except ValueError:
+        return False
+
+
+def gregorian_to_jdn(gy: int, gm: int, gd: int) -> int:
+    """Julian Day Number of a Gregorian date"""
+    d = (_div((gy + _div(gm - 8, 6) + 100100) * 1461, 4)
+         + _div(153 * _mod(gm + 9, 12) + 2, 5)
+         + gd - 34840408)
+    return d - _div(_div(gy + 100100 + _div(gm - 8, 6), 100) * 3, 4) + 752
+
+
+def jdn_to_gregorian(jdn: int) -> tuple[int, int, int]:
+    """Gregorian (year, month, day) of a Julian Day Number"""
+    j = 4 * jdn + 139361631
+    j = j + _div(_div(4 * jdn + 183187720, 146097) * 3, 4) * 4 - 3908
+    i = _div(_mod(j, 1461), 4) * 5 + 308
+    gd = _div(_mod(i, 153), 5) + 1
+    gm = _mod(_div(i, 153), 12) + 1
+    gy = _div(j, 1461) - 100100 + _div(8 - gm, 6)
+    return gy, gm, gd
+
+
+def jalali_to_jdn(jy: int, jm: int, jd: int) -> int:
+    """Julian Day Number of a Jalali date
+
+    Raises:
+        ValueError: If the date does not exist
+    """
+    if not is_valid_jalali(jy, jm, jd):
+        raise ValueError(f"Invalid Jalali date {jy}/{jm}/{jd}")
+    _, gy, march = _jal_cal(jy)
+    return gregorian_to_jdn(gy, 3, march) + (jm - 1) * 31 - _div(jm, 7) * (jm - 7) + jd - 1
+
+
+def jdn_to_jalali(jdn: int) -> tuple[int, int, int]:
+    """Jalali (year, month, day) of a Julian Day Number"""
+    gy = jdn_to_gregorian(jdn)[0]
+    jy = gy - 621
+    leap, _, march = _jal_cal(jy)
+    k = jdn - gregorian_to_jdn(gy, 3, march)
+
+    if k >= 0:
+        if k <= 185:
+            # First six months have 31 days
+            return jy, 1 + _div(k, 31), _mod(k, 31) + 1
+        k -= 186
+    else:
+        jy -= 1
+        k += 179
+        if leap == 1:
+            k += 1
+
+    return jy, 7 + _div(k, 30), _mod(k, 30) + 1
+
+
+def jalali_to_gregorian(jy: int, jm: int, jd: int) -> tuple[int, int, int]:
+    """Convert a Jalali date to Gregorian (year, month, day)
+
+    Raises:
+        ValueError: If the date does not exist
+    """
+    return jdn_to_gregorian(jalali_to_jdn(jy, jm, jd))
+
+
+def gregorian_to_jalali(gy: int, gm: int, gd: int) -> tuple[int, int, int]:
+    """Convert a Gregorian date to Jalali (year, month, day)"""
+    return jdn_to_jalali(gregorian_to_jdn(gy, gm, gd))
+
+
+def jalali_to_ordinal(jy: int, jm: int, jd: int) -> int:
+    """Proleptic Gregorian ordinal (as in date.toordinal) of a Jalali date
+
+    Raises:
+        ValueError: If the date does not exist
+    """
+    return jalali_to_jdn(jy, jm, jd) - ORDINAL_OFFSET
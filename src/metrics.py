@@ -0,0 +1,194 @@
+"""
+Pipeline Metrics
+Lightweight timing spans per pipeline stage, exported as JSON and Prometheus text format
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+# Prefix of every exported Prometheus metric
+METRIC_PREFIX = "class_schedule"
+
+
+class Span:
+    """A running stage measurement; add items and mark failures while it is open"""
+    __slots__ = ('name', 'items', 'failed')
+
+    def __init__(self, name: str, items: int = 0):
+        self.name = name
+        self.items = items
+        self.failed = False
+
+    def add(self, count: int = 1) -> None:
+        """Count items processed by the stage"""
+        self.items += count
+
+    def fail(self) -> None:
+        """Mark the stage as failed without raising"""
+        self.failed = True
+
+
+class StageStats:
+    """Aggregate of every span recorded for one stage"""
+    __slots__ = ('calls', 'seconds', 'max_seconds', 'items', 'failures')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.items = 0
+        self.failures = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'seconds': round(self.seconds, 6),
+            'max_seconds': round(self.max_seconds, 6),
+            'items': self.items,
+            'failures': self.failures,
+        }
+
+
+class Metrics:
+    """Thread-safe registry of stage spans for one run
+
+    Spans of the same stage are folded into a single StageStats, so
+    per-course spans cost constant memory however many courses there are.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None):
+        self.enabled = config.metrics_enabled if enabled is None else enabled
+        self._stages: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all recorded spans and restart the run clock"""
+        with self._lock:
+            self._stages.clear()
+            self.started_at = datetime.now(timezone.utc)
+            self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, items: int = 0) -> Iterator[Span]:
+        """Time a stage; exceptions raised inside count as failures
+
+        Args:
+            name: Stage name, e.g. "login" or "course_page"
+            items: Items processed, can be added to through the span
+
+        Yields:
+            Span to count items on or mark as failed
+        """
+        span = Span(name, items)
+        if not self.enabled:
+            yield span
+            return
+
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException:
+            span.failed = True
+            raise
+        finally:
+            self.record(name, time.perf_counter() - started, span.items, span.failed)
+
+    def record(self, name: str, seconds: float, items: int = 0, failed: bool = False) -> None:
+        """Add a finished measurement to a stage"""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = StageStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.items += items
+            stats.failures += int(failed)
+
+    def report(self) -> Dict[str, Any]:
+        """Run summary with every stage in the order it first ran"""
+        with self._lock:
+            return {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'duration_seconds': round(time.perf_counter() - self._started, 6),
+                'stages': {name: stats.to_dict() for name, stats in self._stages.items()},
+            }
+
+    def to_prometheus(self) -> str:
+        """Run summary in Prometheus text exposition format"""
+        report = self.report()
+        series = [
+            ('stage_duration_seconds', 'Seconds spent in the stage during the last run', 'seconds'),
+            ('stage_duration_max_seconds', 'Longest single span of the stage during the last run', 'max_seconds'),
+            ('stage_calls', 'Spans recorded for the stage during the last run', 'calls'),
+            ('stage_items', 'Items processed by the stage during the last run', 'items'),
+            ('stage_failures', 'Failed spans of the stage during the last run', 'failures'),
+        ]
+
+        lines = []
+        for metric, help_text, key in series:
+            name = f"{METRIC_PREFIX}_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for stage, stats in report['stages'].items():
+                lines.append(f'{name}{{stage="{_escape_label(stage)}"}} {stats[key]}')
+
+        lines.append(f"# HELP {METRIC_PREFIX}_run_duration_seconds Duration of the last run")
+        lines.append(f"# TYPE {METRIC_PREFIX}_run_duration_seconds gauge")
+        lines.append(f"{METRIC_PREFIX}_run_duration_seconds {report['duration_seconds']}")
+        lines.append(f"# HELP {METRIC_PREFIX}_last_run_timestamp_seconds Start of the last run as a Unix timestamp")
+        lines.append(f"# TYPE {METRIC_PREFIX}_last_run_timestamp_seconds gauge")
+        lines.append(f"{METRIC_PREFIX}_last_run_timestamp_seconds {self.started_at.timestamp():.0f}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, json_path: Optional[str] = None, prometheus_path: Optional[str] = None) -> Optional[tuple[str, str]]:
+        """Write the JSON report and the Prometheus textfile
+
+        Both files are replaced atomically, as node_exporter's textfile
+        collector may read them at any time.
+
+        Returns:
+            Tuple of (JSON path, Prometheus path), None if disabled or writing failed
+        """
+        if not self.enabled:
+            return None
+        json_path = json_path or config.metrics_json_path
+        prometheus_path = prometheus_path or config.metrics_prometheus_path
+        try:
+            _write_atomic(json_path, json.dumps(self.report(), indent=2))
+            _write_atomic(prometheus_path, self.to_prometheus())
+            return json_path, prometheus_path
+        except Exception as e:
+            logger.warning(f"Could not export metrics: {e}")
+            return None
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _write_atomic(path: str, content: str) -> None:
+    """Write a file through a temporary file and rename"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding='utf-8') as file:
+        file.write(content)
+    os.replace(temp_path, path)
+
+
+# Shared by every stage of the process
+metrics = Metrics()
@@ -0,0 +1,81 @@
+"""
+Schedule Records
+Compact typed records for courses and their sessions
+"""
+
+import hashlib
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Dict, Any, Iterable, List
+
+# Format of session times shown to the user
+DISPLAY_FORMAT = "%Y/%m/%d - %H:%M"
+
+
+def make_course_id(course_name: str) -> str:
+    """Short stable identifier derived from a course name"""
+    return hashlib.sha1(course_name.encode('utf-8')).hexdigest()[:10]
+
+
+@dataclass(frozen=True, slots=True)
+class Session:
+    """A single class session with its Gregorian start and end times"""
+    uid: str
+    start: datetime
+    end: datetime
+
+    @property
+    def start_display(self) -> str:
+        return self.start.strftime(DISPLAY_FORMAT)
+
+    @property
+    def end_display(self) -> str:
+        return self.end.strftime(DISPLAY_FORMAT)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible representation"""
+        return {'uid': self.uid, 'start': self.start.isoformat(), 'end': self.end.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Session":
+        """Rebuild a session from to_dict output"""
+        return cls(data['uid'], datetime.fromisoformat(data['start']), datetime.fromisoformat(data['end']))
+
+
+@dataclass(frozen=True, slots=True)
+class Course:
+    """A course and its sessions in schedule order"""
+    name: str
+    sessions: tuple[Session, ...]
+
+    @property
+    def course_id(self) -> str:
+        return make_course_id(self.name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible representation"""
+        return {'name': self.name, 'sessions': [session.to_dict() for session in self.sessions]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Course":
+        """Rebuild a course from to_dict output"""
+        return cls(data['name'], tuple(Session.from_dict(session) for session in data['sessions']))
+
+
+def unique_session_uids(courses: Iterable[Course]) -> List[Course]:
+    """Suffix repeated session UIDs with their occurrence number
+
+    UIDs derive from the course name and start time, so a repeated session
+    row, or two sections sharing a name and start time, would otherwise
+    collide. Occurrences are counted in schedule order, so the first one
+    keeps the plain UID.
+    """
+    seen: Dict[str, int] = {}
+    results = []
+    for course in courses:
+        sessions = []
+        for session in course.sessions:
+            count = seen[session.uid] = seen.get(session.uid, 0) + 1
+            sessions.append(session if count == 1 else replace(session, uid=f"{session.uid}-{count}"))
+        results.append(replace(course, sessions=tuple(sessions)))
+    return results
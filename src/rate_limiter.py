@@ -0,0 +1,222 @@
+"""
+Adaptive Request Governor
+Paces portal requests with a token bucket per host and AIMD concurrency control
+"""
+
+import time
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+# Status codes the portal uses to ask clients to slow down
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+# Factor applied to the concurrency limit on congestion
+DECREASE_FACTOR = 0.5
+
+# Requests in flight during a congestion event all report it; only the first
+# one within this many seconds shrinks the limit
+DECREASE_COOLDOWN = 1.0
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average with bursts of up to `burst`"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next `seconds`, e.g. after Retry-After"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class RequestSlot:
+    """Outcome of one governed request, reported by the caller"""
+    __slots__ = ('status_code', 'retry_after', 'failed')
+
+    def __init__(self):
+        self.status_code: Optional[int] = None
+        self.retry_after: Optional[float] = None
+        self.failed = False
+
+    def record(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        """Record the HTTP status and Retry-After header of the response"""
+        self.status_code = status_code
+        try:
+            self.retry_after = float(retry_after) if retry_after else None
+        except ValueError:
+            # HTTP-date form, not worth parsing
+            self.retry_after = None
+
+    @property
+    def congested(self) -> bool:
+        """Whether the request failed or the portal asked to slow down"""
+        return self.failed or (self.status_code is not None and
+                               (self.status_code in THROTTLE_STATUS_CODES or self.status_code >= 500))
+
+
+class HostLimiter:
+    """Token bucket and adaptive concurrency limit of a single host
+
+    The limit grows by one per limit's worth of fast successful requests
+    sent while every slot was in use (additive increase), up to
+    max_concurrency, and halves on 429/503, server errors, exceptions or
+    responses slower than slow_seconds (multiplicative decrease).
+    """
+
+    def __init__(self, rate: float, burst: int, initial_concurrency: int,
+                 max_concurrency: int, slow_seconds: float):
+        self.bucket = TokenBucket(rate, burst)
+        self.limit = float(initial_concurrency)
+        self.max_concurrency = max_concurrency
+        self.slow_seconds = slow_seconds
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until the host has a free concurrency slot and a token"""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+        self.bucket.acquire()
+
+    def release(self, latency: float, slot: RequestSlot) -> None:
+        """Free a slot and adapt the limit to the request's outcome"""
+        with self._condition:
+            # A limit that was not reached says nothing about a higher one
+            binding = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            if slot.congested or latency > self.slow_seconds:
+                self._decrease(latency, slot)
+            elif binding:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+        if slot.retry_after and slot.status_code in THROTTLE_STATUS_CODES:
+            self.bucket.pause(slot.retry_after)
+
+    def _decrease(self, latency: float, slot: RequestSlot) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        self.limit = max(1.0, self.limit * DECREASE_FACTOR)
+        logger.info(f"Backing off to {int(self.limit)} concurrent requests "
+                    f"(status {slot.status_code}, failed {slot.failed}, {latency:.1f}s)")
+
+
+class RequestGovernor:
+    """Shared pacing for every request sent to the portal"""
+
+    def __init__(self, enabled: Optional[bool] = None, rate: Optional[float] = None,
+                 burst: Optional[int] = None, initial_concurrency: Optional[int] = None,
+                 max_concurrency: Optional[int] = None, slow_seconds: Optional[float] = None):
+        self.enabled = config.rate_limit_enabled if enabled is None else enabled
+        self.rate = rate or config.rate_limit_per_second
+        self.burst = burst or config.rate_limit_burst
+        self.initial_concurrency = initial_concurrency or config.rate_limit_initial_concurrency
+        self.max_concurrency = max_concurrency or config.rate_limit_max_concurrency
+        self.slow_seconds = slow_seconds or config.rate_limit_slow_seconds
+        self._hosts: Dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def for_host(self, host: str) -> HostLimiter:
+        """Get the limiter of a host, creating it on first use"""
+        with self._lock:
+            limiter = self._hosts.get(host)
+            if limiter is None:
+                limiter = self._hosts[host] = HostLimiter(
+                    self.rate, self.burst, self.initial_concurrency, self.max_concurrency, self.slow_seconds
+                )
+            return limiter
+
+    @contextmanager
+    def request(self, url: str) -> Iterator[RequestSlot]:
+        """Hold a request slot for a URL's host while the request runs
+
+        Exceptions raised inside the block count as failed requests.
+
+        Args:
+            url: Absolute URL about to be requested
+
+        Yields:
+            RequestSlot to record the response status in
+        """
+        slot = RequestSlot()
+        if not self.enabled:
+            yield slot
+            return
+
+        limiter = self.for_host(urlsplit(url).netloc)
+        limiter.acquire()
+        started = time.monotonic()
+        try:
+            yield slot
+        except Exception:
+            slot.failed = True
+            raise
+        finally:
+            limiter.release(time.monotonic() - started, slot)
+
+
+# Shared by every fetcher, driver and account of the process
+request_governor = RequestGovernor()
+
+
+def governed_get(driver, url: str, governor: Optional[RequestGovernor] = None) -> None:
+    """Load a URL in a WebDriver under the request governor
+
+    Args:
+        driver: WebDriver instance
+        url: Absolute URL to load
+        governor: Governor to use, defaults to the shared one
+    """
+    with (governor or request_governor).request(url):
+        driver.get(url)
+
+
+def backoff_delay(attempt: int, base: Optional[float] = None, cap: Optional[float] = None) -> float:
+    """Exponential backoff with full jitter before retrying a failed request
+
+    Args:
+        attempt: Number of attempts that already failed, starting at 0
+        base: Delay ceiling of the first retry, defaults to config.fetch_backoff_base
+        cap: Largest delay ceiling, defaults to config.fetch_backoff_max
+
+    Returns:
+        Seconds to wait, uniformly drawn below min(cap, base * 2 ** attempt)
+    """
+    base = config.fetch_backoff_base if base is None else base
+    cap = config.fetch_backoff_max if cap is None else cap
+    return random.uniform(0, min(cap, base * 2 ** attempt))
@@ -0,0 +1,92 @@
+"""
+Recurrence Detection
+Groups a course's sessions into weekly series that can be written as one recurring event
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterator, List, Sequence, Union
+
+from src.models import Session
+
+WEEK = timedelta(weeks=1)
+
+# Fewest sessions worth a recurring event
+MIN_SERIES_LENGTH = 3
+
+# Longest run of skipped weeks kept inside a series; longer breaks start a new one
+MAX_SKIPPED_WEEKS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class WeeklySeries:
+    """Sessions repeating every week at the same time, with skipped weeks excluded"""
+    uid: str
+    start: datetime
+    end: datetime
+    count: int
+    exdates: tuple[datetime, ...]
+
+    def __len__(self) -> int:
+        return self.count - len(self.exdates)
+
+    def occurrences(self) -> Iterator[tuple[datetime, datetime]]:
+        """Expanded (start, end) of every session in the series"""
+        excluded = set(self.exdates)
+        for week in range(self.count):
+            start = self.start + week * WEEK
+            if start not in excluded:
+                yield start, self.end + week * WEEK
+
+
+def _to_series(run: List[Session]) -> WeeklySeries:
+    """Build the series covering a run of same-slot sessions"""
+    first = run[0]
+    weeks = {(session.start - first.start) // WEEK for session in run}
+    count = max(weeks) + 1
+    exdates = tuple(first.start + week * WEEK for week in range(count) if week not in weeks)
+    return WeeklySeries(f"{first.uid}-weekly", first.start, first.end, count, exdates)
+
+
+def group_weekly(sessions: Sequence[Session]) -> List[Union[WeeklySeries, Session]]:
+    """Group sessions into weekly series, leaving off-pattern sessions single
+
+    Sessions share a series when they fall on the same weekday, start time
+    and duration, with at most MAX_SKIPPED_WEEKS skipped weeks between them.
+    Expanding the result yields exactly the input sessions.
+
+    Args:
+        sessions: Sessions of one course
+
+    Returns:
+        Series and single sessions ordered by start
+    """
+    slots = {}
+    for session in sessions:
+        key = (session.start.weekday(), session.start.time(), session.end - session.start)
+        slots.setdefault(key, []).append(session)
+
+    grouped: List[Union[WeeklySeries, Session]] = []
+    for slot_sessions in slots.values():
+        slot_sessions.sort(key=lambda session: session.start)
+        runs: List[List[Session]] = []
+        for session in slot_sessions:
+            if runs:
+                gap = session.start - runs[-1][-1].start
+                if gap == timedelta(0):
+                    # Duplicate of the previous session, cannot share the series
+                    grouped.append(session)
+                    continue
+                if gap <= (MAX_SKIPPED_WEEKS + 1) * WEEK:
+                    runs[-1].append(session)
+                    continue
+            runs.append([session])
+
+        for run in runs:
+            if len(run) >= MIN_SERIES_LENGTH:
+                grouped.append(_to_series(run))
+            else:
+                grouped.extend(run)
+
+    grouped.sort(key=lambda item: item.start)
+    return grouped
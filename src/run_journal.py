@@ -0,0 +1,107 @@
+"""
+Run Journal
+Checkpoints finished course pages so an interrupted run resumes where it stopped
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from src.config import config
+from src.models import Course
+
+logger = logging.getLogger(__name__)
+
+
+class RunJournal:
+    """Append-only JSON Lines log of course pages parsed in the current run
+
+    Each finished page costs one appended line, so checkpoints stay cheap
+    for long course lists and a crash loses at most the page being written.
+    """
+
+    def __init__(self, path: str, max_age: Optional[float] = None, owner: Optional[str] = None):
+        """
+        Args:
+            path: Journal file path
+            max_age: Seconds after which a journal is stale, defaults to
+                     config.run_journal_max_age
+            owner: Username the run belongs to; journals of other users are discarded
+        """
+        self.path = path
+        self.max_age = max_age if max_age is not None else config.run_journal_max_age
+        # Stored instead of the username itself, like the session cache file names
+        self.owner = hashlib.sha256(owner.encode('utf-8')).hexdigest()[:16] if owner else None
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, List[Course]]:
+        """Read the courses of every page finished by an unfinished earlier run
+
+        Journals older than max_age or written for another owner are
+        discarded, as are lines cut off by a crash.
+
+        Returns:
+            Parsed courses keyed by course page URL
+        """
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.max_age:
+                logger.info("Discarding stale run journal")
+                self.clear()
+                return {}
+            with open(self.path, "r", encoding='utf-8') as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return {}
+
+        header = self._read_header(lines)
+        if header is None or header.get('owner') != self.owner:
+            logger.info("Discarding run journal of another account")
+            self.clear()
+            return {}
+
+        done = {}
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+                done[entry['url']] = [Course.from_dict(course) for course in entry['courses']]
+            except (ValueError, KeyError, TypeError):
+                logger.debug("Skipping incomplete run journal line")
+        if done:
+            logger.info(f"Resuming run: {len(done)} course pages already done")
+        return done
+
+    def record(self, url: str, courses: List[Course]) -> None:
+        """Checkpoint a finished course page
+
+        Args:
+            url: Absolute course page URL
+            courses: Courses parsed from the page
+        """
+        line = json.dumps({'url': url, 'courses': [course.to_dict() for course in courses]}, ensure_ascii=False)
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding='utf-8') as file:
+                # First line of a new journal names its owner
+                if file.tell() == 0:
+                    file.write(json.dumps({'owner': self.owner}) + "\n")
+                file.write(line + "\n")
+
+    @staticmethod
+    def _read_header(lines: List[str]) -> Optional[Dict[str, Any]]:
+        """Header line of a journal, None if it is missing or unreadable"""
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return None
+        return header if isinstance(header, dict) and 'owner' in header else None
+
+    def clear(self) -> None:
+        """Delete the journal once a run has finished"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
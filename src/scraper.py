@@ -3,215 +3,659 @@ Web Scraper for University Course Data
 Handles extraction of course information and session schedules
 """
 
+import os
+import re
+import time
 import logging
-from typing import List, Dict, Any
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Any, Optional, Callable, Iterable, Iterator, NamedTuple
+import requests
 from bs4 import BeautifulSoup
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from src.date_converter import DateConverter
+from selenium.webdriver.support.ui import WebDriverWait
+from src.course_cache import CourseCache
+from src.driver_pool import DriverPool
+from src.http_fetcher import HttpFetcher, SessionExpiredError
+from src.metrics import metrics
+from src.models import Course, unique_session_uids
+from src.rate_limiter import backoff_delay, governed_get
+from src.run_journal import RunJournal
+from src.session_parser import create_session_parser
 from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Rows highlighted with this background are not regular courses
+HIGHLIGHTED_ROW_STYLE = "background-color: rgb(255, 238, 186);"
+
+# Same highlight as written in raw server HTML, where the browser has not
+# normalized the inline style yet
+HIGHLIGHTED_ROW_PATTERN = re.compile(
+    r'background-color\s*:\s*(rgb\(\s*255\s*,\s*238\s*,\s*186\s*\)|#ffeeba)',
+    re.IGNORECASE
+)
+
+# Collects the filtered course rows and their links in one round-trip.
+# Returns null while the courses table is not present yet.
+COURSE_ROWS_SCRIPT = """
+const table = document.getElementById('table');
+if (!table) { return null; }
+const rows = Array.from(table.getElementsByTagName('tr'))
+    .filter(row => !row.style.cssText.includes(arguments[0]));
+const hrefs = [];
+rows.forEach(row => row.querySelectorAll('a[href]')
+    .forEach(link => hrefs.push(link.getAttribute('href'))));
+return {rows: rows.map(row => row.outerHTML), hrefs: hrefs};
+"""
+
+# Collects the course title and session cells in one round-trip.
+# Returns null until both the title and the sessions table are present.
+COURSE_SESSIONS_SCRIPT = """
+const title = document.getElementsByTagName('h4')[0];
+const table = document.getElementsByClassName('table')[0];
+if (!title || !table) { return null; }
+return {
+    title: title.outerHTML,
+    cells: Array.from(table.getElementsByTagName('td')).map(cell => cell.outerHTML)
+};
+"""
+
+# Intermediate pipeline results written to the temp directory when
+# config.persist_temp_files is set
+DEBUG_FILES = ("urls.txt", "absolute_urls.txt", "dates.html")
+
+
+class CoursePage(NamedTuple):
+    """Content extracted from a single course page"""
+    url: str
+    # Course title followed by the session cells
+    html: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # Portal answered 304, html comes from the course cache
+    not_modified: bool = False
+    # Page can never be read (e.g. missing its sessions table), so it is
+    # not retried
+    skipped: bool = False
+
+
+class IncompleteRunError(Exception):
+    """Raised when course pages still fail after all retries"""
+
+
+class CoursePageError(ValueError):
+    """Raised for a course page lacking its title or sessions table"""
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether a failed course page fetch is worth retrying
+
+    Network errors, timeouts, 429 and 5xx responses may go away on their
+    own; other HTTP errors and malformed pages fail the same way every time.
+    """
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is None or status == 429 or status >= 500
+    return isinstance(error, (requests.RequestException, OSError, WebDriverException))
+
 
 class Scraper:
     """Handles web scraping operations for university course data"""
     
-    def __init__(self, driver, wait):
+    def __init__(self, driver, wait, driver_factory: Optional[Callable[[], Any]] = None,
+                 temp_dir: Optional[str] = None, output_dir: Optional[str] = None,
+                 ics_filename: str = 'class_schedule.ics', show_debug_info: bool = True,
+                 username: Optional[str] = None):
+        """
+        Args:
+            driver: Logged-in WebDriver instance
+            wait: WebDriverWait bound to driver
+            driver_factory: Callable creating extra drivers for the driver pool;
+                            pages are loaded in driver alone when not provided
+            temp_dir: Directory for debug files and the course cache,
+                      defaults to config.TEMP_DIR
+            output_dir: Directory of the ICS file, defaults to config.OUTPUT_DIR
+            ics_filename: Name of the ICS file
+            show_debug_info: Print the extracted schedule before writing it
+            username: Account the run belongs to; run journals of other
+                      accounts are not resumed
+        """
         self.driver = driver
         self.wait = wait
+        self.driver_factory = driver_factory
+        self.driver_pool: Optional[DriverPool] = None
         self.base_url = config.base_url
+        self.extraction_mode = config.extraction_mode
+        self.fetch_mode = config.fetch_mode
+        self.max_concurrent_fetches = config.max_concurrent_fetches
+        self.fetcher: Optional[HttpFetcher] = None
+        self.temp_dir = temp_dir or config.TEMP_DIR
+        self.output_dir = output_dir or config.OUTPUT_DIR
+        self.ics_filename = ics_filename
+        self.show_debug_info = show_debug_info
+        self.course_cache: Optional[CourseCache] = None
+        if config.course_cache_enabled:
+            cache_path = os.path.join(temp_dir, "course_cache.json") if temp_dir else None
+            self.course_cache = CourseCache(cache_path)
+        self.journal: Optional[RunJournal] = None
+        if config.run_journal_enabled:
+            self.journal = RunJournal(os.path.join(self.temp_dir, "run_journal.jsonl"), owner=username)
+        self.session_parser = create_session_parser(config.parser_backend)
+
+        if self.fetch_mode == "http":
+            self.fetcher = HttpFetcher.from_driver(
+                driver, pool_size=config.http_pool_size, timeout=config.http_timeout
+            )
     
-    def go_to_courses(self) -> None:
-        """Navigate to courses page and extract course URLs"""
+    def go_to_courses(self) -> List[Course]:
+        """Navigate to courses page and run the extraction pipeline
+        
+        Course rows flow through in-memory stages: absolute URLs, per-course
+        HTML, parsed sessions and finally the ICS file. Finished pages are
+        checkpointed in the run journal, so a run that crashed or left pages
+        failing resumes with the remaining pages only. Pages that can never be
+        read keep their sessions from the course cache, or fail the run.
+        
+        Returns:
+            Courses written to the ICS file
+            
+        Raises:
+            IncompleteRunError: If course pages still failed after all retries,
+                                or can never be read and are not cached; the
+                                ICS file is left untouched so no sessions are
+                                cancelled for courses that could not be read
+        """
         try:
             logger.info("Navigating to courses page...")
-            self.driver.get(config.courses_url)
+            with metrics.span("course_list") as span:
+                rows, hrefs = self._load_course_rows_with_retries()
+                span.add(len(rows) - 1)
+            self._write_debug_file("urls.txt", rows)
+            
+            logger.info(f"Found {len(rows) - 1} courses to process")
+            urls = self._course_urls(rows, hrefs)
+            parsed = self.journal.load() if self.journal else {}
+            pending = [url for url in urls if url not in parsed]
+            for url, classes in self._iter_parsed_pages(self._iter_course_pages(pending)):
+                parsed[url] = classes
+                if self.journal:
+                    self.journal.record(url, classes)
 
-            # Wait for courses table to load
-            table = self.wait.until(
-                EC.presence_of_element_located((By.ID, 'table'))
-            )
-            rows = table.find_elements(By.TAG_NAME, 'tr')
+            if self.course_cache:
+                self.course_cache.save()
 
-            urls = []
-            for row in rows:
-                # Skip rows with specific background color
-                style = row.get_attribute('style')
-                if "background-color: rgb(255, 238, 186);" in style:
-                    continue
-                
-                html = row.get_attribute('outerHTML')
-                urls.append(str(html))
-            
-            # Save course URLs
-            with open("src/temp/urls.txt", "w", encoding='utf-8') as file:
-                file.writelines(urls)
-            
-            logger.info(f"Found {len(urls) - 1} courses to process")
-            self._process_course_urls()
+            failed = [url for url in urls if url not in parsed]
+            if failed:
+                raise IncompleteRunError(
+                    f"{len(failed)} of {len(urls)} course pages failed; run again to resume with them"
+                )
+            results = unique_session_uids(course for url in urls for course in parsed[url])
+
+            # Process extracted data and create calendar
+            self._create_ics_file(results)
+            if self.journal:
+                self.journal.clear()
+            return results
             
         except Exception as e:
             logger.error(f"Failed to extract courses: {e}")
             raise   
-    
-    def _process_course_urls(self) -> None:
-        """Process course URLs and extract absolute links"""
+
+    def _load_course_rows_with_retries(self) -> tuple[List[str], Optional[List[str]]]:
+        """Load the courses table, retrying transient failures with backoff
+        
+        Raises:
+            Exception: The last error once retries are used up, or any
+                       error that is not transient
+        """
+        attempts = config.fetch_retries + 1
+        for attempt in range(attempts):
+            try:
+                return self._load_course_rows()
+            except Exception as e:
+                if attempt + 1 == attempts or not is_transient_error(e):
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning(f"Failed to load courses page ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _load_course_rows(self) -> tuple[List[str], Optional[List[str]]]:
+        """Load the courses table with the configured fetch mode
+        
+        Returns:
+            Tuple of (row HTML strings, relative course hrefs or None if
+            they still have to be parsed from the rows)
+        """
+        if self.fetch_mode == "http":
+            rows, hrefs = self._collect_course_rows_http()
+            if rows is not None:
+                return rows, hrefs
+            # Table is missing from the server HTML, so it needs the browser
+            logger.warning("Courses table not found over HTTP - falling back to browser")
+            self.fetch_mode = "browser"
+
+        governed_get(self.driver, config.courses_url)
+        if self.extraction_mode == "script":
+            return self._collect_course_rows_script()
+        return self._collect_course_rows_element(), None
+
+    @property
+    def temporary_files(self) -> List[str]:
+        """Paths of the debug files written to the temp directory"""
+        return [os.path.join(self.temp_dir, filename) for filename in DEBUG_FILES]
+
+    def clear_temporary_files(self) -> None:
+        """Empty the debug files left in the temp directory"""
+        for path in self.temporary_files:
+            if not os.path.exists(path):
+                continue
+            try:
+                open(path, "w").close()
+                logger.debug(f"Cleared: {path}")
+            except Exception as e:
+                logger.warning(f"Could not clear {path}: {e}")
+
+    def _write_debug_file(self, filename: str, chunks: Iterable[str], mode: str = "w") -> None:
+        """Persist an intermediate pipeline result when config.persist_temp_files is set
+        
+        Args:
+            filename: File name inside the temp directory
+            chunks: Text chunks to write
+            mode: File open mode
+        """
+        if not config.persist_temp_files:
+            return
         try:
-            with open("src/temp/urls.txt", "r", encoding='utf-8') as file:
-                text = file.read()
-            
-            soup = BeautifulSoup(text, 'html.parser')
-            links = soup.find_all('a', href=True)
+            os.makedirs(self.temp_dir, exist_ok=True)
+            with open(os.path.join(self.temp_dir, filename), mode, encoding='utf-8') as file:
+                file.writelines(chunks)
+        except Exception as e:
+            logger.warning(f"Could not write debug file {filename}: {e}")
+
+    def _collect_course_rows_element(self) -> List[str]:
+        """Collect course rows by querying each row through WebDriver
+        
+        Returns:
+            List of row outerHTML strings, excluding highlighted rows
+        """
+        # Wait for courses table to load
+        table = self.wait.until(
+            EC.presence_of_element_located((By.ID, 'table'))
+        )
+        rows = table.find_elements(By.TAG_NAME, 'tr')
 
-            # Save absolute URLs
-            with open("src/temp/absolute_urls.txt", "w", encoding='utf-8') as wfile:
-                for link in links:
-                    absolute_url = self.base_url + link['href']
-                    wfile.write(absolute_url + '\n')
+        urls = []
+        for row in rows:
+            # Skip rows with specific background color
+            style = row.get_attribute('style')
+            if HIGHLIGHTED_ROW_STYLE in style:
+                continue
             
-            self._process_each_course()
+            html = row.get_attribute('outerHTML')
+            urls.append(str(html))
+        
+        return urls
+
+    def _collect_course_rows_script(self) -> tuple[List[str], List[str]]:
+        """Collect course rows and links with a single in-browser script call
+        
+        Returns:
+            Tuple of (row outerHTML strings, relative course hrefs)
+        """
+        payload = self.wait.until(
+            lambda driver: driver.execute_script(COURSE_ROWS_SCRIPT, HIGHLIGHTED_ROW_STYLE)
+        )
+        return payload['rows'], payload['hrefs']
+
+    def _collect_course_rows_http(self) -> tuple[Optional[List[str]], Optional[List[str]]]:
+        """Collect course rows and links from the courses page fetched over HTTP
+        
+        Returns:
+            Tuple of (row HTML strings, relative course hrefs),
+            or (None, None) if the page has no courses table
+        """
+        soup = BeautifulSoup(self.fetcher.fetch(config.courses_url), 'html.parser')
+        table = soup.find(id='table')
+        if table is None:
+            return None, None
+
+        rows = [
+            row for row in table.find_all('tr')
+            if not HIGHLIGHTED_ROW_PATTERN.search(row.get('style', ''))
+        ]
+        hrefs = [link['href'] for row in rows for link in row.find_all('a', href=True)]
+        return [str(row) for row in rows], hrefs
+    
+    def _course_urls(self, rows: List[str], hrefs: Optional[List[str]] = None) -> List[str]:
+        """Build absolute course URLs
+        
+        Args:
+            rows: Course row HTML strings
+            hrefs: Relative course links already collected in the browser;
+                   parsed from rows when not provided
             
-        except Exception as e:
-            logger.error(f"Failed to process course URLs: {e}")
-            raise
+        Returns:
+            Absolute course page URLs in table order
+        """
+        if hrefs is None:
+            soup = BeautifulSoup(''.join(rows), 'html.parser')
+            hrefs = [link['href'] for link in soup.find_all('a', href=True)]
+
+        urls = [self.base_url + href.strip() for href in hrefs if href.strip()]
+        self._write_debug_file("absolute_urls.txt", (url + '\n' for url in urls))
+        return urls
     
-    def _process_each_course(self) -> None:
-        """Process each course to extract session data"""
-        try:
-            with open("src/temp/absolute_urls.txt", "r", encoding='utf-8') as file:
-                lines = file.readlines()
+    def _iter_course_pages(self, urls: List[str]) -> Iterator[CoursePage]:
+        """Fetch course pages, concurrently when the fetch mode allows it
+        
+        At most config.pipeline_buffer_size pages are fetched ahead of the
+        consumer, so memory stays bounded for long course lists.
+        
+        Args:
+            urls: Absolute course page URLs
             
-            for line in lines:
-                line = line.strip()
-                if len(line) > 5:
-                    self._extract_course_sessions(line)
+        Yields:
+            Course pages in the same order as urls; pages that failed are skipped
+        """
+        if self.fetch_mode == "http":
+            workers = self.max_concurrent_fetches
+        else:
+            # A single WebDriver can only load one page at a time
+            workers = self._start_driver_pool(len(urls))
+        workers = max(1, min(workers, len(urls)))
 
-            # Process extracted data and create calendar
-            result = self._extract_class_sessions()
-            self._create_ics_file(result)
+        if workers == 1:
+            for url in urls:
+                page = self._extract_course_sessions(url)
+                if page is not None:
+                    yield page
+            return
+
+        logger.info(f"Fetching {len(urls)} course pages with {workers} workers")
+        window = max(workers, config.pipeline_buffer_size)
+        remaining = iter(urls)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque(
+                executor.submit(self._extract_course_sessions, url)
+                for url in itertools.islice(remaining, window)
+            )
+            while pending:
+                # Results are taken in submission order
+                page = pending.popleft().result()
+                next_url = next(remaining, None)
+                if next_url is not None:
+                    pending.append(executor.submit(self._extract_course_sessions, next_url))
+                if page is not None:
+                    yield page
+
+    def _iter_parsed_pages(self, pages: Iterable[CoursePage]) -> Iterator[tuple[str, List[Course]]]:
+        """Parse the courses of each fetched course page
+        
+        Pages that are unchanged since the last run, either answered with 304
+        or with identical HTML, reuse the sessions parsed back then. Pages that
+        can never be read keep the sessions last parsed from them, so their
+        events are not cancelled; without those they are left out like pages
+        that failed.
+        
+        Args:
+            pages: Fetched course pages
             
-        except Exception as e:
-            logger.error(f"Failed to process courses: {e}")
-            raise
+        Yields:
+            Tuples of (course page URL, courses parsed from it)
+        """
+        self._write_debug_file("dates.html", [])
+        for page in pages:
+            self._write_debug_file("dates.html", [page.html], mode="a")
+
+            classes = None if page.skipped else self._parse_course_page(page)
+            if classes is None:
+                classes = self.course_cache.previous(page.url) if self.course_cache else None
+                if classes is None:
+                    continue
+                logger.warning(f"Keeping the last known sessions of unreadable course: {page.url}")
+
+            yield page.url, classes
+
+    def _parse_course_page(self, page: CoursePage) -> Optional[List[Course]]:
+        """Parse the courses of a course page, reusing cached sessions when unchanged
+        
+        Args:
+            page: Fetched course page
+            
+        Returns:
+            Parsed courses, or None if the page could not be parsed
+        """
+        with metrics.span("parse") as span:
+            # A 304 page carries the cached HTML, so it always matches here
+            classes = self.course_cache.lookup(page.url, page.html) if self.course_cache else None
+            if classes is None:
+                try:
+                    classes = self._extract_class_sessions(page.html)
+                except Exception:
+                    # Parsing the same HTML again fails again, so it is not retried
+                    logger.error(f"Course page could not be parsed: {page.url}")
+                    span.fail()
+                    return None
+            else:
+                status = "not modified" if page.not_modified else "unchanged"
+                logger.debug(f"Course {status}, reusing cached sessions: {page.url}")
+            span.add(sum(len(course.sessions) for course in classes))
+
+        if self.course_cache:
+            self.course_cache.put(page.url, page.html, classes, page.etag, page.last_modified)
+        return classes
     
-    def _extract_course_sessions(self, url: str) -> None:
-        """Extract session data from a course page"""
+    def _start_driver_pool(self, page_count: int) -> int:
+        """Start the driver pool for browser fetch mode if it is configured
+        
+        Args:
+            page_count: Number of pages about to be loaded
+            
+        Returns:
+            Number of pages that can be loaded in parallel
+        """
+        if self.driver_pool:
+            return self.driver_pool.size
+        if not self.driver_factory or config.driver_pool_size < 1 or page_count < 2:
+            return 1
+
+        pool = DriverPool(self.driver_factory, min(config.driver_pool_size, page_count))
         try:
-            logger.debug(f"Extracting sessions from: {url}")
-            self.driver.get(url)
+            pool.start(self.driver)
+        except Exception as e:
+            logger.warning(f"Could not start driver pool, loading pages sequentially: {e}")
+            pool.close()
+            return 1
+
+        self.driver_pool = pool
+        return pool.size
+
+    def _extract_course_sessions(self, url: str) -> Optional[CoursePage]:
+        """Extract session data from a course page
+        
+        Transient failures are retried config.fetch_retries times with
+        exponential backoff and jitter; an expired session is not retried.
+        Pages failing for any other reason are returned as skipped, as
+        retrying them would fail the same way.
+        
+        Args:
+            url: Absolute course page URL
+            
+        Returns:
+            Extracted course page, or None if it failed
+        """
+        with metrics.span("course_page", items=1) as span:
+            page = self._fetch_with_retries(url)
+            if page is None or page.skipped:
+                span.fail()
+            return page
+
+    def _fetch_with_retries(self, url: str) -> Optional[CoursePage]:
+        """Fetch a course page, retrying failed attempts with backoff"""
+        attempts = config.fetch_retries + 1
+        for attempt in range(attempts):
+            try:
+                logger.debug(f"Extracting sessions from: {url}")
+                return self._fetch_course_page(url)
+
+            except SessionExpiredError as e:
+                logger.error(f"Failed to extract sessions from {url}: {e}")
+                return None
+            except Exception as e:
+                if not is_transient_error(e):
+                    logger.error(f"Skipping course page {url}: {e}")
+                    return CoursePage(url, "", skipped=True)
+                if attempt + 1 == attempts:
+                    logger.error(f"Failed to extract sessions from {url} after {attempts} attempts: {e}")
+                    return None
+                delay = backoff_delay(attempt)
+                logger.warning(f"Failed to extract sessions from {url} ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
 
-            # Wait for page elements
-            title = self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, 'h4'))
+    def _fetch_course_page(self, url: str) -> CoursePage:
+        """Fetch a course page once with the configured fetch mode"""
+        if self.fetch_mode == "http":
+            return self._collect_sessions_http(url)
+        if self.driver_pool:
+            title_html, cells_html = self.driver_pool.run(
+                lambda driver: self._collect_sessions_browser(driver, url)
             )
-            table = self.wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, 'table'))
+        else:
+            title_html, cells_html = self._collect_sessions_browser(self.driver, url)
+        return CoursePage(url, title_html + ''.join(cells_html))
+
+    def _collect_sessions_browser(self, driver, url: str) -> tuple[str, List[str]]:
+        """Load a course page in a browser and collect its title and session cells
+        
+        Args:
+            driver: WebDriver to load the page in
+            url: Absolute course page URL
+            
+        Returns:
+            Tuple of (title outerHTML, session cell outerHTML strings)
+        """
+        governed_get(driver, url)
+        wait = self.wait if driver is self.driver else WebDriverWait(driver, config.wait_timeout)
+
+        if self.extraction_mode == "script":
+            return self._collect_sessions_script(wait)
+        return self._collect_sessions_element(wait)
+
+    def _collect_sessions_element(self, wait: WebDriverWait) -> tuple[str, List[str]]:
+        """Collect course title and session cells element by element
+        
+        Args:
+            wait: WebDriverWait bound to the driver showing the course page
+            
+        Returns:
+            Tuple of (title outerHTML, session cell outerHTML strings)
+        """
+        # Wait for page elements
+        title = wait.until(
+            EC.presence_of_element_located((By.TAG_NAME, 'h4'))
+        )
+        table = wait.until(
+            EC.presence_of_element_located((By.CLASS_NAME, 'table'))
+        )
+        rows = table.find_elements(By.TAG_NAME, 'td')
+        
+        return title.get_attribute('outerHTML'), [row.get_attribute('outerHTML') for row in rows]
+
+    def _collect_sessions_script(self, wait: WebDriverWait) -> tuple[str, List[str]]:
+        """Collect course title and session cells with a single in-browser script call
+        
+        Args:
+            wait: WebDriverWait bound to the driver showing the course page
+            
+        Returns:
+            Tuple of (title outerHTML, session cell outerHTML strings)
+        """
+        payload = wait.until(
+            lambda driver: driver.execute_script(COURSE_SESSIONS_SCRIPT)
+        )
+        return payload['title'], payload['cells']
+
+    def _collect_sessions_http(self, url: str) -> CoursePage:
+        """Collect course title and session cells from a page fetched over HTTP
+        
+        Pages in the course cache are requested conditionally, so unchanged
+        pages come back as an empty 304 response.
+        
+        Args:
+            url: Absolute course page URL
+            
+        Returns:
+            Extracted course page
+        """
+        entry = self.course_cache.get(url) if self.course_cache else None
+        result = self.fetcher.fetch_conditional(
+            url,
+            etag=entry.get('etag') if entry else None,
+            last_modified=entry.get('last_modified') if entry else None
+        )
+        if result.not_modified:
+            return CoursePage(
+                url, entry['html'],
+                result.etag or entry.get('etag'),
+                result.last_modified or entry.get('last_modified'),
+                not_modified=True
             )
-            rows = table.find_elements(By.TAG_NAME, 'td')
-            
-            # Save session data
-            with open("src/temp/dates.html", "a", encoding='utf-8') as file:            
-                file.write(title.get_attribute('outerHTML'))
-                for row in rows:
-                    file.write(row.get_attribute('outerHTML'))
-                    
-        except Exception as e:
-            logger.error(f"Failed to extract sessions from {url}: {e}")
+
+        soup = BeautifulSoup(result.text, 'html.parser')
+        title = soup.find('h4')
+        table = soup.find(class_='table')
+        if title is None or table is None:
+            raise CoursePageError(f"Course page is missing its title or sessions table: {url}")
+
+        html = str(title) + ''.join(str(cell) for cell in table.find_all('td'))
+        return CoursePage(url, html, result.etag, result.last_modified)
     
-    def _extract_class_sessions(self) -> List[Dict[str, Any]]:
-        """Extract and parse class sessions from saved HTML"""
-        try:
-            with open("src/temp/dates.html", "r", encoding='utf-8') as file:
-                html_content = file.read()
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
-            class_headers = soup.find_all('h4', class_='text-info')
-
-            results = []
-            for class_header in class_headers:
-                class_name = class_header.get_text(strip=True)
-                sessions = self._extract_sessions_for_class(class_header)
-                
-                results.append({
-                    'class_name': class_name,
-                    'sessions': sessions
-                })
+    def _extract_class_sessions(self, html_content: str) -> List[Course]:
+        """Extract and parse class sessions from course page HTML
+        
+        Args:
+            html_content: Course title and session cells HTML
             
-            return results
+        Returns:
+            List of courses with sessions
+        """
+        try:
+            return self.session_parser.parse(html_content)
             
         except Exception as e:
             logger.error(f"Failed to extract class sessions: {e}")
             raise
     
-    def _extract_sessions_for_class(self, class_header) -> List[Dict[str, Any]]:
-        """Extract session data for a specific class"""
-        sessions = []
-        current_element = class_header.next_sibling
-        
-        while current_element and not self._is_next_class_header(current_element):
-            if current_element.name == 'td':
-                td_text = current_element.get_text(strip=True)
-                
-                if td_text == 'جلسه':  # Session
-                    session_data = self._parse_session_data(current_element)
-                    if session_data:
-                        session_data['uid'] = self._generate_session_uid(
-                            class_header.get_text(strip=True), 
-                            len(sessions) + 1, 
-                            session_data['start_gregorian']
-                        )
-                        sessions.append(session_data)
-            
-            current_element = current_element.next_sibling if current_element else None
-        
-        return sessions
-    
-    def _parse_session_data(self, session_element) -> Dict[str, Any]:
-        """Parse individual session data from table elements"""
-        session_data = {}
-        
-        # Extract start date
-        start_td = session_element.find_next_sibling('td')
-        if start_td:
-            start_text = start_td.get_text(strip=True)
-            start_date = DateConverter.extract_date_components(start_text)
-            session_data['start_persian'] = start_date
-            session_data['start_gregorian'] = DateConverter.persian_to_georgian(start_date)
-        
-        # Extract end date
-        end_td = start_td.find_next_sibling('td') if start_td else None
-        if end_td:
-            end_text = end_td.get_text(strip=True)
-            end_date = DateConverter.extract_date_components(end_text)
-            session_data['end_persian'] = end_date
-            session_data['end_gregorian'] = DateConverter.persian_to_georgian(end_date)
-        
-        return session_data if session_data else None
-    
-    def _is_next_class_header(self, element) -> bool:
-        """Check if element is a class header indicating next class"""
-        return (element.name == 'h4' and 
-                'text-info' in element.get('class', []))
-    
-    def _generate_session_uid(self, class_name: str, session_num: int, gregorian_date: str) -> str:
-        """Generate unique ID for calendar event"""
-        return f"{class_name}_{session_num}_{gregorian_date}"
-    
-    def _create_ics_file(self, results: List[Dict[str, Any]]) -> None:
+    def _create_ics_file(self, results: List[Course]) -> None:
         """Create ICS calendar file from extracted sessions"""
         try:
             from src.ics_creator import IcsCreator
             
             # Create ICS file
-            ics_creator = IcsCreator()
-            ics_creator.print_debug_info(results)
-            ics_creator.create_ics_file(results)
+            ics_creator = IcsCreator(self.output_dir)
+            if self.show_debug_info:
+                ics_creator.print_debug_info(results)
+            with metrics.span("ics_write", items=sum(len(course.sessions) for course in results)):
+                ics_creator.create_ics_file(results, self.ics_filename)
             
         except Exception as e:
             logger.error(f"Failed to create ICS file: {e}")
             raise
 
+    def close(self) -> None:
+        """Release pooled HTTP connections and pool drivers"""
+        if self.fetcher:
+            self.fetcher.close()
+            self.fetcher = None
+        if self.driver_pool:
+            self.driver_pool.close()
+            self.driver_pool = None
+
 # For backward compatibility during transition
 def go_to_courses():
     """Legacy function - use Scraper class instead"""
@@ -0,0 +1,86 @@
+"""
+Authenticated Session Cache
+Stores portal session cookies on disk so repeat runs can skip the login form
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from typing import List, Dict, Any, Optional
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """Persists session cookies per username with an expiry"""
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[float] = None):
+        self.cache_dir = cache_dir or config.session_cache_dir
+        self.ttl = ttl if ttl is not None else config.session_cache_ttl
+
+    def _path(self, username: str) -> str:
+        """Cache file path for a username, without exposing the username itself"""
+        digest = hashlib.sha256(username.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def load(self, username: str) -> Optional[List[Dict[str, Any]]]:
+        """Load cached cookies for a username
+
+        Args:
+            username: University portal username
+
+        Returns:
+            Cached cookies, or None if missing, unreadable or expired
+        """
+        path = self._path(username)
+        try:
+            with open(path, "r", encoding='utf-8') as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable session cache {path}: {e}")
+            return None
+
+        if time.time() - entry.get('saved_at', 0) > self.ttl:
+            logger.info("Cached session expired")
+            self.clear(username)
+            return None
+
+        return entry.get('cookies') or None
+
+    def save(self, username: str, cookies: List[Dict[str, Any]]) -> None:
+        """Save cookies for a username, readable by the current user only
+
+        Args:
+            username: University portal username
+            cookies: Cookies as returned by driver.get_cookies()
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(username)
+            # The mode only applies to newly created files, so write a fresh
+            # file and swap it in rather than reusing one with looser permissions
+            temp_path = path + ".tmp"
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "w", encoding='utf-8') as file:
+                json.dump({'saved_at': time.time(), 'cookies': cookies}, file)
+            os.replace(temp_path, path)
+            logger.debug(f"Session cached: {path}")
+        except Exception as e:
+            logger.warning(f"Could not cache session: {e}")
+
+    def clear(self, username: str) -> None:
+        """Remove the cached session for a username"""
+        try:
+            os.remove(self._path(username))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not remove cached session: {e}")
@@ -0,0 +1,217 @@
+"""
+Course Session Parsers
+Turns course page HTML into class sessions with interchangeable parser backends
+"""
+
+import time
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import List, Optional
+
+from bs4 import BeautifulSoup
+
+from src.date_converter import DateConverter
+from src.metrics import metrics
+from src.models import Course, Session, make_course_id
+
+logger = logging.getLogger(__name__)
+
+# Text of the cell that starts a session row
+SESSION_MARKER = 'جلسه'
+
+# Elements that never have a closing tag
+VOID_ELEMENTS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+})
+
+
+class SessionParser(ABC):
+    """Base class for course page parser backends"""
+
+    @abstractmethod
+    def parse(self, html_content: str) -> List[Course]:
+        """Parse class sessions from course page HTML
+
+        Args:
+            html_content: Course title and session cells HTML
+
+        Returns:
+            List of courses with their sessions
+        """
+
+    @staticmethod
+    def _parse_session_data(course_name: str, session_num: int,
+                            start_text: Optional[str], end_text: Optional[str]) -> Optional[Session]:
+        """Convert the start and end cell texts of a session
+
+        Args:
+            course_name: Name of the course the session belongs to
+            session_num: 1-based position of the session within its course
+            start_text: Text of the start date cell, None if missing
+            end_text: Text of the end date cell, None if missing
+
+        Returns:
+            Session, or None if either date is missing or invalid
+        """
+        # Recorded directly, a span context manager per session costs more than the conversion
+        started = time.perf_counter()
+        start = DateConverter.to_datetime(start_text) if start_text is not None else None
+        end = DateConverter.to_datetime(end_text) if end_text is not None else None
+        metrics.record("convert", time.perf_counter() - started, 1, start is None or end is None)
+        if start is None or end is None:
+            logger.warning(f"Skipping session {session_num} of {course_name}: invalid dates {start_text!r} - {end_text!r}")
+            return None
+
+        return Session(SessionParser._generate_session_uid(course_name, start), start, end)
+
+    @staticmethod
+    def _generate_session_uid(course_name: str, start: datetime) -> str:
+        """Generate unique ID for calendar event, stable across runs
+
+        Based on the start time rather than the session's position, so
+        adding or dropping a session leaves the other UIDs unchanged.
+        """
+        return f"{make_course_id(course_name)}-{start:%Y%m%dT%H%M}"
+
+
+class BeautifulSoupSessionParser(SessionParser):
+    """Parser backend walking a full BeautifulSoup tree"""
+
+    def parse(self, html_content: str) -> List[Course]:
+        soup = BeautifulSoup(html_content, 'html.parser')
+        class_headers = soup.find_all('h4', class_='text-info')
+
+        results = []
+        for class_header in class_headers:
+            class_name = class_header.get_text(strip=True)
+            sessions = self._extract_sessions_for_class(class_header, class_name)
+            results.append(Course(class_name, tuple(sessions)))
+
+        return results
+
+    def _extract_sessions_for_class(self, class_header, class_name: str) -> List[Session]:
+        """Extract session data for a specific class"""
+        sessions = []
+        current_element = class_header.next_sibling
+
+        while current_element and not self._is_next_class_header(current_element):
+            if current_element.name == 'td':
+                td_text = current_element.get_text(strip=True)
+
+                if td_text == SESSION_MARKER:
+                    start_td = current_element.find_next_sibling('td')
+                    end_td = start_td.find_next_sibling('td') if start_td else None
+                    session = self._parse_session_data(
+                        class_name,
+                        len(sessions) + 1,
+                        start_td.get_text(strip=True) if start_td else None,
+                        end_td.get_text(strip=True) if end_td else None
+                    )
+                    if session:
+                        sessions.append(session)
+
+            current_element = current_element.next_sibling if current_element else None
+
+        return sessions
+
+    def _is_next_class_header(self, element) -> bool:
+        """Check if element is a class header indicating next class"""
+        return (element.name == 'h4' and
+                'text-info' in element.get('class', []))
+
+
+class _TokenScanner(HTMLParser):
+    """Single-pass scanner collecting top-level class headers and cells with their text"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tokens: List[tuple[str, str]] = []
+        self._depth = 0
+        self._current: Optional[str] = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self._depth == 0:
+            classes = (dict(attrs).get('class') or '').split()
+            if tag == 'td' or (tag == 'h4' and 'text-info' in classes):
+                self._current = tag
+                self._text = []
+            else:
+                self._current = None
+        if tag not in VOID_ELEMENTS:
+            self._depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS or self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth == 0 and self._current:
+            self.tokens.append((self._current, ''.join(self._text)))
+            self._current = None
+
+    def handle_data(self, data):
+        # Same text as get_text(strip=True): each string stripped, empties dropped
+        if self._current and self._depth:
+            stripped = data.strip()
+            if stripped:
+                self._text.append(stripped)
+
+
+class FastSessionParser(SessionParser):
+    """Parser backend scanning the HTML once without building a tree"""
+
+    def parse(self, html_content: str) -> List[Course]:
+        scanner = _TokenScanner()
+        scanner.feed(html_content)
+        scanner.close()
+        tokens = scanner.tokens
+
+        # Positions of every cell, to find the cells following a session marker
+        cell_positions = [index for index, (tag, _) in enumerate(tokens) if tag == 'td']
+        next_cell = {}
+        for position, index in enumerate(cell_positions):
+            next_cell[index] = cell_positions[position + 1] if position + 1 < len(cell_positions) else None
+
+        courses: List[tuple[str, List[Session]]] = []
+        for index, (tag, text) in enumerate(tokens):
+            if tag == 'h4':
+                courses.append((text, []))
+            elif courses and text == SESSION_MARKER:
+                class_name, sessions = courses[-1]
+                start_index = next_cell[index]
+                end_index = next_cell[start_index] if start_index is not None else None
+                session = self._parse_session_data(
+                    class_name,
+                    len(sessions) + 1,
+                    tokens[start_index][1] if start_index is not None else None,
+                    tokens[end_index][1] if end_index is not None else None
+                )
+                if session:
+                    sessions.append(session)
+
+        return [Course(class_name, tuple(sessions)) for class_name, sessions in courses]
+
+
+PARSER_BACKENDS = {
+    'fast': FastSessionParser,
+    'bs4': BeautifulSoupSessionParser,
+}
+
+
+def create_session_parser(backend: str) -> SessionParser:
+    """Create the parser for a backend name, falling back to BeautifulSoup
+
+    Args:
+        backend: One of PARSER_BACKENDS
+
+    Returns:
+        SessionParser instance
+    """
+    parser_class = PARSER_BACKENDS.get(backend)
+    if parser_class is None:
+        logger.warning(f"Unknown parser backend '{backend}', using BeautifulSoup")
+        parser_class = BeautifulSoupSessionParser
+    return parser_class()
@@ -5,10 +5,15 @@ Handles authentication and browser session management for the university portal
 
 import time
 import logging
-from typing import Optional
+from typing import Optional, List, Dict, Any
 from src.config import config
+from src.http_fetcher import HttpFetcher, LOGIN_PATH
+from src.metrics import metrics
+from src.rate_limiter import governed_get
+from src.session_cache import SessionCache
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -19,33 +24,35 @@ from webdriver_manager.chrome import ChromeDriverManager
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Resources blocked over CDP by the performance browser profile
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"
+]
+
+# Elements signalling the outcome of a login attempt
+LOGOUT_LINK_XPATH = "//a[contains(text(), 'Logout') or contains(@href, 'Logout')]"
+LOGIN_ERROR_SELECTOR = ".validation-summary-errors, .field-validation-error, .alert-danger"
+
 class UniversityLogin:
     """Handles university portal authentication and browser management"""
     def __init__(self):
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
         self.login_url = config.login_url
+        self.session_cache = SessionCache()
+        # Seconds between submitting the login form and detecting its outcome
+        self.login_detection_seconds: Optional[float] = None
     
     def setup_driver(self):
         """Setup and configure Chrome driver with appropriate options"""
         try:
             logger.info("Setting up Chrome driver...")
             
-            chrome_options = Options()
-            # Add essential options for stability
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            
-            # Initialize driver with WebDriverManager
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
+            self.driver = self.create_driver()
             
             # Set up wait for element interactions
-            self.wait = WebDriverWait(self.driver, 10)
+            self.wait = WebDriverWait(self.driver, config.wait_timeout)
             
             logger.info("Chrome driver setup completed successfully")
             
@@ -54,6 +61,57 @@ class UniversityLogin:
             raise
     
 
+    @staticmethod
+    def create_driver() -> webdriver.Chrome:
+        """Create a new Chrome driver with the application's options
+        
+        Returns:
+            Configured Chrome WebDriver instance
+        """
+        chrome_options = Options()
+        # Add essential options for stability
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+
+        performance = config.browser_profile == "performance"
+        if performance:
+            UniversityLogin._apply_performance_profile(chrome_options)
+        
+        with metrics.span("driver_startup", items=1):
+            # Initialize driver with WebDriverManager
+            driver = webdriver.Chrome(
+                service=Service(ChromeDriverManager().install()),
+                options=chrome_options
+            )
+
+            if performance:
+                # Prefs cannot block fonts, so drop them at the network layer
+                try:
+                    driver.execute_cdp_cmd("Network.enable", {})
+                    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
+                except Exception as e:
+                    logger.warning(f"Could not enable CDP request blocking: {e}")
+
+        return driver
+
+    @staticmethod
+    def _apply_performance_profile(chrome_options: Options) -> None:
+        """Configure a lean headless browser for scraping
+        
+        Args:
+            chrome_options: Chrome options to update
+        """
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        # Return from get() once the DOM is parsed; waits still target the table
+        chrome_options.page_load_strategy = "eager"
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+
     def login(self, username: str, password: str) -> bool:
         """Login to university portal with provided credentials
         
@@ -64,11 +122,19 @@ class UniversityLogin:
         Returns:
             bool: True if login successful, False otherwise
         """
+        with metrics.span("login") as span:
+            success = self._submit_login(username, password)
+            if not success:
+                span.fail()
+            return success
+
+    def _submit_login(self, username: str, password: str) -> bool:
+        """Fill in and submit the login form, then wait for its outcome"""
         try:
             logger.info("Attempting to login to university portal...")
             
             # Navigate to login page
-            self.driver.get(self.login_url)
+            governed_get(self.driver, self.login_url)
             logger.debug("Navigated to login page")
             
             # Wait for and populate username field
@@ -89,9 +155,15 @@ class UniversityLogin:
             logger.debug("Login button clicked")
             
             # Wait for login process to complete
-            time.sleep(3)
+            outcome = self._wait_for_login_outcome()
+            if outcome == "success":
+                logger.info("Login successful!")
+                return True
+            if outcome == "error":
+                logger.warning("Login rejected by portal")
+                return False
             
-            # Check if login was successful by looking for dashboard or error
+            # Timed out - check if login was successful by looking for dashboard or error
             if self._is_login_successful():
                 logger.info("Login successful!")
                 return True
@@ -104,6 +176,102 @@ class UniversityLogin:
             return False
 
 
+    def _wait_for_login_outcome(self) -> Optional[str]:
+        """Wait until the first sign of login success or failure appears
+        
+        Returns:
+            "success", "error", or None if nothing was detected before config.login_timeout
+        """
+        start = time.perf_counter()
+        try:
+            outcome = WebDriverWait(self.driver, config.login_timeout, poll_frequency=0.1).until(
+                self._detect_login_outcome
+            )
+        except TimeoutException:
+            outcome = None
+
+        self.login_detection_seconds = time.perf_counter() - start
+        metrics.record("login_detection", self.login_detection_seconds, failed=outcome is None)
+        logger.info(f"Login outcome '{outcome}' detected in {self.login_detection_seconds:.2f}s")
+        return outcome
+
+    @staticmethod
+    def _detect_login_outcome(driver):
+        """Wait condition returning the login outcome once it is visible, False before that"""
+        # find_elements returns immediately instead of raising when nothing matches
+        for element in driver.find_elements(By.CSS_SELECTOR, LOGIN_ERROR_SELECTOR):
+            if element.is_displayed() and element.text.strip():
+                return "error"
+
+        if LOGIN_PATH not in driver.current_url:
+            return "success"
+        if driver.find_elements(By.XPATH, LOGOUT_LINK_XPATH):
+            return "success"
+        return False
+
+    def login_with_cache(self, username: str, password: str) -> bool:
+        """Restore a cached session if it is still valid, otherwise login
+        
+        Args:
+            username: University portal username
+            password: University portal password
+            
+        Returns:
+            bool: True if an authenticated session is available, False otherwise
+        """
+        if not config.session_cache_enabled:
+            return self.login(username, password)
+
+        cookies = self.session_cache.load(username)
+        if cookies:
+            with metrics.span("session_restore") as span:
+                restored = self._is_session_valid(cookies) and self.restore_session(cookies)
+                if not restored:
+                    span.fail()
+            if restored:
+                logger.info("Reusing cached session - login skipped")
+                return True
+            logger.info("Cached session rejected by portal")
+            self.session_cache.clear(username)
+
+        if not self.login(username, password):
+            return False
+
+        self.session_cache.save(username, self.driver.get_cookies())
+        return True
+
+    def _is_session_valid(self, cookies: List[Dict[str, Any]]) -> bool:
+        """Check cached cookies with a single HTTP request to the courses page"""
+        fetcher = HttpFetcher(pool_size=1, timeout=config.http_timeout)
+        try:
+            fetcher.load_cookies(cookies)
+            fetcher.fetch(config.courses_url)
+            return True
+        except Exception as e:
+            logger.debug(f"Cached session validation failed: {e}")
+            return False
+        finally:
+            fetcher.close()
+
+    def restore_session(self, cookies: List[Dict[str, Any]]) -> bool:
+        """Load cached cookies into the browser
+        
+        Args:
+            cookies: Cookies as returned by driver.get_cookies()
+            
+        Returns:
+            bool: True if all cookies were restored, False otherwise
+        """
+        try:
+            # Cookies can only be added for the domain currently loaded
+            governed_get(self.driver, config.base_url)
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not restore cached session: {e}")
+            return False
+
     def _is_login_successful(self) -> bool:
         """Check if login was successful by looking for indicators on the page"""
         try:
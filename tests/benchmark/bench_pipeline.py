@@ -0,0 +1,219 @@
+"""
+Offline Pipeline Benchmarks
+Times the parse, date conversion and ICS write stages on synthetic portal data
+
+    python -m tests.benchmark.bench_pipeline [--sizes 1 20 200 5000] [--output FILE] [--compare BASELINE]
+
+Results are saved as JSON (by default out/benchmarks/<commit>.json) and can be
+compared against the baseline of another commit.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import config
+from src.date_converter import DateConverter
+from src.ics_creator import IcsCreator
+from src.scraper import Scraper
+from src.session_parser import create_session_parser
+from tests.fixture.sample_data import generate_courses, generate_date_strings
+from tests.fixture.sample_html import generate_course_pages
+
+DEFAULT_SIZES = [1, 20, 200, 5000]
+BASELINE_DIR = os.path.join(config.OUTPUT_DIR, "benchmarks")
+
+# Date strings converted per course, about one semester of start and end times
+DATES_PER_COURSE = 32
+
+# Relative slowdown of a metric reported as a regression by --compare;
+# timings of single runs vary by about 10-20% between runs on the same machine
+REGRESSION_THRESHOLD = 0.25
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of samples"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def measure(operations: Sequence[Callable[[], Any]], items: int) -> Dict[str, float]:
+    """Time each operation, then run them again under tracemalloc for peak memory
+
+    Args:
+        operations: Calls making up one benchmark stage
+        items: Items processed by all operations, for throughput
+
+    Returns:
+        Throughput, latency percentiles per operation and peak memory
+    """
+    latencies = []
+    started = time.perf_counter()
+    for operation in operations:
+        operation_started = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - operation_started)
+    elapsed = time.perf_counter() - started
+
+    # Separate pass, tracemalloc slows allocations down
+    tracemalloc.start()
+    for operation in operations:
+        operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'items': items,
+        'seconds': round(elapsed, 6),
+        'items_per_second': round(items / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 4),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 4),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def bench_parse(course_count: int) -> Dict[str, float]:
+    """Scraper._extract_class_sessions, one call per course page"""
+    scraper = Scraper.__new__(Scraper)
+    scraper.session_parser = create_session_parser(config.parser_backend)
+    pages = list(generate_course_pages(course_count))
+    DateConverter.configure_cache(config.date_cache_size)
+    return measure([lambda html=html: scraper._extract_class_sessions(html) for html in pages], len(pages))
+
+
+def bench_convert(course_count: int) -> Dict[str, float]:
+    """DateConverter.convert_persian_date_string, one call per date string"""
+    dates = generate_date_strings(course_count * DATES_PER_COURSE)
+
+    def reset_then(date_string: str, first: bool):
+        # Every pass starts from cold memo caches
+        if first:
+            DateConverter.configure_cache(config.date_cache_size)
+        DateConverter.convert_persian_date_string(date_string)
+
+    return measure([lambda d=d, i=i: reset_then(d, i == 0) for i, d in enumerate(dates)], len(dates))
+
+
+def bench_convert_many(course_count: int) -> Dict[str, float]:
+    """DateConverter.convert_many over all date strings at once"""
+    dates = generate_date_strings(course_count * DATES_PER_COURSE)
+    DateConverter.convert_many(dates[:1])  # Build the lookup table outside the timing
+    return measure([lambda: DateConverter.convert_many(dates)], len(dates))
+
+
+def bench_ics(course_count: int, repeats: int = 5) -> Dict[str, float]:
+    """IcsCreator.create_ics_file writing a full calendar from scratch"""
+    courses = generate_courses(course_count)
+    sessions = sum(len(course.sessions) for course in courses)
+    with tempfile.TemporaryDirectory() as output_dir:
+        creator = IcsCreator(output_dir)
+
+        def write():
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                creator.create_ics_file(courses, incremental=False)
+
+        return measure([write] * repeats, sessions * repeats)
+
+
+STAGES = {
+    'parse': bench_parse,
+    'convert': bench_convert,
+    'convert_many': bench_convert_many,
+    'ics': bench_ics,
+}
+
+
+def git_commit() -> Optional[str]:
+    """Short hash of the checked out commit, None outside a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: List[int], stages: List[str]) -> Dict[str, Any]:
+    """Run the selected stages for every size"""
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'parser_backend': config.parser_backend,
+        },
+        'results': {},
+    }
+    for stage in stages:
+        report['results'][stage] = {}
+        for size in sizes:
+            result = STAGES[stage](size)
+            report['results'][stage][str(size)] = result
+            print(f"{stage:>12} {size:>5} courses: {result['items_per_second']:>12,.0f} items/s  "
+                  f"p50 {result['p50_ms']:.3f} ms  p99 {result['p99_ms']:.3f} ms  "
+                  f"peak {result['peak_memory_kb']:,.0f} KiB")
+    return report
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """Describe metrics that got worse than the baseline by more than threshold"""
+    regressions = []
+    for stage, sizes in report['results'].items():
+        for size, result in sizes.items():
+            old = baseline.get('results', {}).get(stage, {}).get(size)
+            if not old:
+                continue
+            checks = [
+                ('items_per_second', old['items_per_second'] / result['items_per_second'] if result['items_per_second'] else float('inf')),
+                ('p99_ms', result['p99_ms'] / old['p99_ms'] if old['p99_ms'] else 1.0),
+                ('peak_memory_kb', result['peak_memory_kb'] / old['peak_memory_kb'] if old['peak_memory_kb'] else 1.0),
+            ]
+            for metric, ratio in checks:
+                if ratio > 1 + threshold:
+                    regressions.append(f"{stage} {size} courses: {metric} {old[metric]} -> {result[metric]}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the parse, convert and ICS stages offline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="course counts to generate")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES))
+    parser.add_argument("--output", help="JSON file for the results (default: out/benchmarks/<commit>.json)")
+    parser.add_argument("--compare", help="baseline JSON to compare the results against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="relative slowdown reported as a regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.stages)
+
+    output = args.output or os.path.join(BASELINE_DIR, f"{report['meta']['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"Saved results to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            regressions = compare(report, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
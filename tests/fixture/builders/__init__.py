@@ -0,0 +1,159 @@
+"""Fakes and builders shared by the unit tests"""
+
+import io
+from datetime import datetime, timedelta, timezone
+
+import requests
+from selenium.common.exceptions import WebDriverException
+
+from src.http_fetcher import FetchResult
+from src.ics_diff import IncrementalIcsWriter, read_events
+from src.ics_writer import IcsWriter
+from src.models import Course, Session
+from src.rate_limiter import RequestGovernor
+from src.scraper import Scraper
+
+DTSTAMP = datetime(2025, 10, 1, 8, 0, tzinfo=timezone.utc)
+
+# Course with a single two-hour session
+MATH = Course("Math", (Session("m-1", datetime(2025, 10, 5, 14, 0), datetime(2025, 10, 5, 16, 0)),))
+
+
+class FakeElement:
+    """Page element with text that may be hidden"""
+
+    def __init__(self, text="", displayed=True):
+        self.text = text
+        self.displayed = displayed
+
+    def is_displayed(self):
+        return self.displayed
+
+
+class FakeDriver:
+    """Logged-in WebDriver that can be made to crash
+
+    Login pages are shown with their current URL, validation errors and
+    logout links.
+    """
+
+    def __init__(self, current_url="https://vc.farspnu.ac.ir/", errors=(), logout_links=()):
+        self.url = current_url
+        self.errors = list(errors)
+        self.logout_links = list(logout_links)
+        self.cookies = []
+        self.crashed = False
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+        return self.url
+
+    def get(self, url):
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+
+    def find_elements(self, by, selector):
+        return self.errors if by == "css selector" else self.logout_links
+
+    def get_cookies(self):
+        return [{'name': 'auth', 'value': 'token', 'domain': 'vc.farspnu.ac.ir', 'path': '/', 'extra': 1}]
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def execute_script(self, script, *args):
+        return "test-agent"
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFetcher:
+    """HttpFetcher serving pages from a dict; unknown URLs are unreachable
+
+    Only conditional requests, as sent for course pages, are counted.
+    """
+
+    def __init__(self, pages, etags=None):
+        self.pages = pages
+        self.etags = etags or {}
+        self.requests = 0
+
+    def fetch(self, url):
+        if url not in self.pages:
+            raise requests.ConnectionError(f"unreachable: {url}")
+        return self.pages[url]
+
+    def fetch_conditional(self, url, etag=None, last_modified=None):
+        self.requests += 1
+        current = self.etags.get(url)
+        if current and etag == current:
+            return FetchResult("", current, None, True)
+        if url not in self.pages:
+            raise requests.ConnectionError(f"unreachable: {url}")
+        return FetchResult(self.pages[url], current, None, False)
+
+    def close(self):
+        pass
+
+
+def make_scraper(pages, **kwargs):
+    """Scraper in HTTP fetch mode over FakeFetcher pages, without course cache"""
+    scraper = Scraper(FakeDriver(), None, show_debug_info=False, **kwargs)
+    scraper.fetcher = FakeFetcher(pages)
+    scraper.course_cache = None
+    return scraper
+
+
+def failing_first(function, *errors):
+    """Wrap function to raise the given errors on its first calls"""
+    remaining = iter(errors)
+
+    def wrapper(*args, **kwargs):
+        error = next(remaining, None)
+        if error:
+            raise error
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def make_course(*sessions, name="Math"):
+    """Course of two-hour sessions given as (uid, start) pairs"""
+    return Course(name, tuple(Session(uid, start, start + timedelta(hours=2)) for uid, start in sessions))
+
+
+def weekly_sessions(weeks, start, hours=2, prefix="m"):
+    """Sessions at the same time in the given weeks after start"""
+    return [Session(f"{prefix}-{index}", start + timedelta(weeks=week), start + timedelta(weeks=week, hours=hours))
+            for index, week in enumerate(weeks, 1)]
+
+
+def write_calendar(courses, previous=None, dtstamp=DTSTAMP, recurrence=False, retired=None):
+    """Write courses to memory, incrementally when previous events are given
+
+    Returns:
+        Tuple of (calendar bytes, writer)
+    """
+    stream = io.BytesIO()
+    if previous is None:
+        writer = IcsWriter(stream, dtstamp, recurrence)
+    else:
+        writer = IncrementalIcsWriter(stream, previous, dtstamp, recurrence, retired)
+    writer.write_calendar(courses)
+    return stream.getvalue(), writer
+
+
+def events_of(content):
+    """Events of calendar bytes keyed by UID"""
+    return read_events(io.BytesIO(content))
+
+
+def make_governor(**overrides):
+    """RequestGovernor that is fast unless overridden"""
+    settings = dict(enabled=True, rate=1000, burst=1000, initial_concurrency=2, max_concurrency=8, slow_seconds=5)
+    settings.update(overrides)
+    return RequestGovernor(**settings)
@@ -0,0 +1,71 @@
+"""Synthetic schedule data for tests and benchmarks"""
+
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+from src import jalali
+from src.models import Course, Session, make_course_id
+
+PERSIAN_DIGITS = str.maketrans('0123456789', '۰۱۲۳۴۵۶۷۸۹')
+PERSIAN_MONTHS = ['فروردین', 'اردیبهشت', 'خرداد', 'تیر', 'مرداد', 'شهریور',
+                  'مهر', 'آبان', 'آذر', 'دی', 'بهمن', 'اسفند']
+# Indexed by date.weekday(), Monday first
+PERSIAN_WEEKDAYS = ['دوشنبه', 'سه شنبه', 'چهارشنبه', 'پنج شنبه', 'جمعه', 'شنبه', 'یکشنبه']
+
+# Start of the synthetic semester, 1 Mehr 1404
+SEMESTER_START = datetime(2025, 9, 23, 8, 0)
+CLASS_HOURS = [8, 10, 14, 16, 18]
+
+
+def persian_date_string(value: datetime) -> str:
+    """Format a datetime the way the portal shows session times"""
+    year, month, day = jalali.gregorian_to_jalali(value.year, value.month, value.day)
+    text = f"{PERSIAN_WEEKDAYS[value.weekday()]} {day} {PERSIAN_MONTHS[month - 1]} {year} - {value.hour:02d}:{value.minute:02d}"
+    return text.translate(PERSIAN_DIGITS)
+
+
+def course_name(index: int) -> str:
+    """Name of the index-th synthetic course"""
+    return f"درس شماره {index + 1} - گروه {index % 7 + 1}".translate(PERSIAN_DIGITS)
+
+
+def generate_session_times(rng: random.Random, min_sessions: int = 1,
+                           max_sessions: int = 24) -> List[tuple[datetime, datetime]]:
+    """Weekly (start, end) times of one course with an occasional skipped week and make-up session"""
+    first = SEMESTER_START + timedelta(days=rng.randrange(7), hours=rng.choice(CLASS_HOURS) - SEMESTER_START.hour)
+    duration = timedelta(minutes=rng.choice([90, 120]))
+    times = []
+    for week in range(rng.randint(min_sessions, max_sessions)):
+        start = first + timedelta(weeks=week)
+        if rng.random() < 0.05:
+            # Make-up session on another day
+            start += timedelta(days=rng.randint(1, 3))
+        elif rng.random() < 0.05:
+            continue
+        times.append((start, start + duration))
+    return times
+
+
+def generate_courses(course_count: int, seed: int = 0, min_sessions: int = 1,
+                     max_sessions: int = 24) -> List[Course]:
+    """Parsed courses matching generate_course_pages with the same arguments"""
+    rng = random.Random(seed)
+    courses = []
+    for index in range(course_count):
+        name = course_name(index)
+        course_id = make_course_id(name)
+        times = generate_session_times(rng, min_sessions, max_sessions)
+        courses.append(Course(name, tuple(
+            Session(f"{course_id}-{start:%Y%m%dT%H%M}", start, end) for start, end in times
+        )))
+    return courses
+
+
+def generate_date_strings(count: int, seed: int = 0) -> List[str]:
+    """Persian session date strings spread over several years"""
+    rng = random.Random(seed)
+    return [
+        persian_date_string(SEMESTER_START + timedelta(days=rng.randrange(4 * 365), hours=rng.choice(CLASS_HOURS) - 8))
+        for _ in range(count)
+    ]
@@ -0,0 +1,47 @@
+"""Sample course page HTML as collected by the scraper"""
+
+import random
+
+from tests.fixture.sample_data import course_name, generate_session_times, persian_date_string
+
+# Two courses back to back with the quirks seen on the portal: whitespace
+# between cells, nested markup, entities and a non-class h4
+COURSE_PAGES = (
+    '<h4 class="text-info">  ریاضی عمومی ۱  </h4>\n'
+    '<td>جلسه</td>\n<td>یکشنبه ۱۳ مهر ۱۴۰۴ - ۱۴:۰۰</td>\n<td>یکشنبه ۱۳ مهر ۱۴۰۴ - ۱۶:۰۰</td>\n'
+    '<td>آنلاین</td>\n'
+    '<td> <span>جلسه</span> </td><td>یکشنبه <b>۲۰</b> مهر ۱۴۰۴ - ۱۴:۰۰</td><td>یکشنبه ۲۰ مهر ۱۴۰۴ - ۱۶:۰۰</td>\n'
+    '<h4>Not a class</h4>\n'
+    '<td>جلسه</td><td>پنج شنبه ۲۴ مهر ۱۴۰۴ - ۱۸:۰۰</td><td>پنج شنبه ۲۴ مهر ۱۴۰۴ - ۱۹:۳۰<br/></td>\n'
+    '<h4 class="mb-2 text-info">Physics &amp; Lab</h4>'
+    '<td>جلسه</td><td>دوشنبه ۱۴ اسفند ۱۴۰۴ - ۰۸:۰۰</td><td>دوشنبه ۱۴ اسفند ۱۴۰۴ - ۱۰:۰۰</td>'
+    '<td>جلسه</td><td>invalid</td>'
+)
+
+
+def generate_course_page(name: str, session_times) -> str:
+    """Course title and session cells as collected from a course page"""
+    cells = ''.join(
+        f'<td>جلسه</td><td>{persian_date_string(start)}</td><td>{persian_date_string(end)}</td><td>آنلاین</td>\n'
+        for start, end in session_times
+    )
+    return f'<h4 class="text-info">{name}</h4>\n{cells}'
+
+
+def generate_course_pages(course_count: int, seed: int = 0, min_sessions: int = 1, max_sessions: int = 24):
+    """Yield the pages of course_count synthetic courses
+
+    Parses to the same courses as sample_data.generate_courses with the same arguments.
+    """
+    rng = random.Random(seed)
+    for index in range(course_count):
+        yield generate_course_page(course_name(index), generate_session_times(rng, min_sessions, max_sessions))
+
+
+def generate_courses_table(course_count: int, highlighted_every: int = 10) -> str:
+    """Courses table of the /Student/Course page, with every n-th row highlighted"""
+    rows = ['<tr><th>Course</th></tr>']
+    for index in range(course_count):
+        style = ' style="background-color: #ffeeba;"' if highlighted_every and index % highlighted_every == highlighted_every - 1 else ''
+        rows.append(f'<tr{style}><td><a href="/Student/Course/Sessions/{index + 1}">Course {index + 1}</a></td></tr>')
+    return '<table id="table">\n' + '\n'.join(rows) + '\n</table>'
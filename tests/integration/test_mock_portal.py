@@ -0,0 +1,87 @@
+import sys
+import os
+
+import pytest
+import requests
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.config import config
+from src.scraper import Scraper
+from tests.fixture.sample_data import generate_courses
+from tests.mock_portal import AUTH_COOKIE, MockPortal
+
+
+class PortalDriver:
+    """Stands in for a logged-in browser holding the portal's auth cookie"""
+
+    def __init__(self, token):
+        self.token = token
+
+    def get_cookies(self):
+        return [{'name': AUTH_COOKIE, 'value': self.token, 'domain': '127.0.0.1', 'path': '/'}]
+
+    def execute_script(self, script, *args):
+        return "mock-agent"
+
+
+@pytest.fixture
+def portal(request):
+    options = getattr(request, 'param', {})
+    previous = config.base_url
+    with MockPortal(course_count=12, **options) as portal:
+        config.set_base_url(portal.base_url)
+        yield portal
+    config.set_base_url(previous)
+
+
+def login(username, password):
+    session = requests.Session()
+    response = session.post(config.login_url, data={'UserName': username, 'password': password, 'login': ''})
+    return response, session.cookies.get(AUTH_COOKIE)
+
+
+def test_login_form_accepts_and_rejects(portal):
+    portal.accounts = {"4001": "secret"}
+    response, token = login("4001", "wrong")
+    assert token is None and "validation-summary-errors" in response.text
+
+    response, token = login("4001", "secret")
+    assert token and "Logout" in response.text
+
+    anonymous = requests.get(config.courses_url)
+    assert "/Identity/Account/Login" in anonymous.url
+
+
+def test_pipeline_runs_end_to_end_against_mock_portal(portal, tmp_path):
+    _, token = login("4001", "secret")
+    scraper = Scraper(PortalDriver(token), None, temp_dir=str(tmp_path / "temp"),
+                      output_dir=str(tmp_path / "out"), show_debug_info=False)
+    try:
+        results = scraper.go_to_courses()
+        # Row 10 is highlighted and skipped
+        expected = [course for index, course in enumerate(generate_courses(12)) if index != 9]
+        assert results == expected
+        assert (tmp_path / "out" / "class_schedule.ics").exists()
+
+        # Second run revalidates every course page with its ETag
+        assert scraper.go_to_courses() == expected
+        assert portal.stats['not_modified'] == 11
+    finally:
+        scraper.close()
+
+
+@pytest.mark.parametrize('portal', [dict(failure_rate=0.2, throttle_rate=0.1, seed=7)], indirect=True)
+def test_pipeline_recovers_from_failing_and_throttling_portal(portal, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "fetch_retries", 10)
+    monkeypatch.setattr(config, "fetch_backoff_base", 0.01)
+    _, token = login("4001", "secret")
+    scraper = Scraper(PortalDriver(token), None, temp_dir=str(tmp_path / "temp"),
+                      output_dir=str(tmp_path / "out"), show_debug_info=False)
+    try:
+        expected = [course for index, course in enumerate(generate_courses(12, seed=7)) if index != 9]
+        assert scraper.go_to_courses() == expected
+        assert portal.stats['failures'] and portal.stats['throttled']
+    finally:
+        scraper.close()
@@ -0,0 +1,285 @@
+"""
+Mock University Portal
+Local stand-in for the portal's login form, courses table and course session pages
+
+    python -m tests.mock_portal [--port 8000] [--courses 20] [--latency 0.05] [--failure-rate 0.02]
+
+Point the pipeline at it with CLASS_SCHEDULE_BASE_URL=http://127.0.0.1:8000
+(or config.set_base_url). Any username is accepted with any non-empty
+password unless accounts are given.
+"""
+
+import os
+import sys
+import html
+import time
+import random
+import hashlib
+import secrets
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, quote, urlsplit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.fixture.sample_data import course_name, generate_session_times, persian_date_string
+
+LOGIN_PATH = "/Identity/Account/Login"
+COURSES_PATH = "/Student/Course"
+SESSIONS_PATH = "/Student/Course/Sessions/"
+AUTH_COOKIE = ".AspNetCore.Identity.Application"
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>Login</title></head><body>
+<form method="post" action="{action}">
+{error}
+<input id="UserName" name="UserName" type="text">
+<input id="password" name="password" type="password">
+<button name="login" type="submit">Login</button>
+</form>
+</body></html>"""
+
+LOGIN_ERROR = '<div class="validation-summary-errors"><ul><li>Invalid login attempt.</li></ul></div>'
+
+LAYOUT = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title></head><body>
+<nav><a href="/Identity/Account/Logout">Logout</a></nav>
+{body}
+</body></html>"""
+
+
+class MockPortal:
+    """Threaded HTTP server imitating the university portal
+
+    Args:
+        course_count: Courses listed in the courses table
+        latency: Seconds added to every response
+        jitter: Random extra latency of up to this many seconds
+        failure_rate: Fraction of protected requests answered with 503
+        throttle_rate: Fraction of protected requests answered with 429 and Retry-After
+        highlighted_every: Every n-th courses table row is highlighted (0 for none)
+        accounts: Accepted username/password pairs, None to accept any non-empty password
+        seed: Seed of the generated schedule
+    """
+
+    def __init__(self, course_count: int = 20, latency: float = 0.0, jitter: float = 0.0,
+                 failure_rate: float = 0.0, throttle_rate: float = 0.0, highlighted_every: int = 10,
+                 accounts: Optional[Dict[str, str]] = None, seed: int = 0):
+        self.course_count = course_count
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.throttle_rate = throttle_rate
+        self.highlighted_every = highlighted_every
+        self.accounts = accounts
+        self._random = random.Random(seed)
+        self._sessions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {'requests': 0, 'logins': 0, 'failures': 0, 'throttled': 0, 'not_modified': 0}
+
+        rng = random.Random(seed)
+        self.courses = [(course_name(index), generate_session_times(rng)) for index in range(course_count)]
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in a background thread
+
+        Returns:
+            Base URL of the server
+        """
+        handler = type("Handler", (_PortalHandler,), {'portal': self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-portal", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        """Shut the server down"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockPortal":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def chance(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self._random.random() < rate
+
+    def delay(self) -> None:
+        extra = 0.0
+        if self.jitter:
+            with self._lock:
+                extra = self._random.uniform(0, self.jitter)
+        if self.latency or extra:
+            time.sleep(self.latency + extra)
+
+    def authenticate(self, username: str, password: str) -> Optional[str]:
+        """Create a session token for valid credentials"""
+        if not username or not password:
+            return None
+        if self.accounts is not None and self.accounts.get(username) != password:
+            return None
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[token] = username
+        return token
+
+    def is_authenticated(self, token: Optional[str]) -> bool:
+        with self._lock:
+            return token in self._sessions
+
+    def courses_page(self) -> str:
+        rows = ['<tr><th>#</th><th>Course</th></tr>']
+        for index, (name, _) in enumerate(self.courses):
+            highlighted = self.highlighted_every and index % self.highlighted_every == self.highlighted_every - 1
+            style = ' style="background-color: #ffeeba;"' if highlighted else ''
+            rows.append(f'<tr{style}><td>{index + 1}</td>'
+                        f'<td><a href="{SESSIONS_PATH}{index + 1}">{html.escape(name)}</a></td></tr>')
+        table = '<table id="table">\n' + '\n'.join(rows) + '\n</table>'
+        return LAYOUT.format(title="Courses", body=table)
+
+    def sessions_page(self, course_number: int) -> Optional[str]:
+        if not 1 <= course_number <= len(self.courses):
+            return None
+        name, times = self.courses[course_number - 1]
+        rows = ''.join(
+            f'<tr><td>جلسه</td><td>{persian_date_string(start)}</td>'
+            f'<td>{persian_date_string(end)}</td><td>آنلاین</td></tr>\n'
+            for start, end in times
+        )
+        body = f'<h4 class="text-info">{html.escape(name)}</h4>\n<table class="table">\n{rows}</table>'
+        return LAYOUT.format(title=name, body=body)
+
+
+class _PortalHandler(BaseHTTPRequestHandler):
+    """Request handler bound to a MockPortal through the portal attribute"""
+    portal: MockPortal
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.portal.count('requests')
+        self.portal.delay()
+        path = urlsplit(self.path).path
+
+        if path == LOGIN_PATH:
+            return self._send(200, LOGIN_PAGE.format(action=html.escape(self.path), error=""))
+        if not self.portal.is_authenticated(self._token()):
+            return self._redirect(f"{LOGIN_PATH}?returnUrl={quote(self.path, safe='')}")
+        if self.portal.chance(self.portal.throttle_rate):
+            self.portal.count('throttled')
+            return self._send(429, "Too Many Requests", {'Retry-After': '1'})
+        if self.portal.chance(self.portal.failure_rate):
+            self.portal.count('failures')
+            return self._send(503, "Service Unavailable")
+
+        if path == "/":
+            return self._send(200, LAYOUT.format(title="Home", body="<h1>Dashboard</h1>"))
+        if path == COURSES_PATH:
+            return self._send(200, self.portal.courses_page())
+        if path.startswith(SESSIONS_PATH):
+            try:
+                page = self.portal.sessions_page(int(path[len(SESSIONS_PATH):]))
+            except ValueError:
+                page = None
+            if page is not None:
+                return self._send_cacheable(page)
+        self._send(404, "Not Found")
+
+    def do_POST(self):
+        self.portal.count('requests')
+        self.portal.delay()
+        path = urlsplit(self.path).path
+        if path != LOGIN_PATH:
+            return self._send(404, "Not Found")
+
+        length = int(self.headers.get('Content-Length') or 0)
+        form = parse_qs(self.rfile.read(length).decode('utf-8'))
+        token = self.portal.authenticate(form.get('UserName', [''])[0], form.get('password', [''])[0])
+        if token is None:
+            return self._send(200, LOGIN_PAGE.format(action=html.escape(self.path), error=LOGIN_ERROR))
+
+        self.portal.count('logins')
+        return_url = parse_qs(urlsplit(self.path).query).get('returnUrl', ['/'])[0]
+        self._redirect(return_url if return_url.startswith('/') else '/',
+                       {'Set-Cookie': f"{AUTH_COOKIE}={token}; Path=/; HttpOnly"})
+
+    def _token(self) -> Optional[str]:
+        for part in (self.headers.get('Cookie') or '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == AUTH_COOKIE:
+                return value
+        return None
+
+    def _send_cacheable(self, body: str) -> None:
+        etag = '"' + hashlib.sha1(body.encode('utf-8')).hexdigest()[:16] + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.portal.count('not_modified')
+            return self._send(304, "", {'ETag': etag})
+        self._send(200, body, {'ETag': etag})
+
+    def _redirect(self, location: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(302, "", {'Location': location, **(headers or {})})
+
+    def _send(self, status: int, body: str, headers: Optional[Dict[str, str]] = None) -> None:
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(data)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a mock university portal for offline runs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--courses", type=int, default=20, help="courses in the courses table")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    portal = MockPortal(args.courses, args.latency, args.jitter, args.failure_rate,
+                        args.throttle_rate, seed=args.seed)
+    base_url = portal.start(args.host, args.port)
+    print(f"Mock portal serving {args.courses} courses at {base_url}")
+    print(f"Run the pipeline against it with CLASS_SCHEDULE_BASE_URL={base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(f"\nStopping: {portal.stats}")
+    finally:
+        portal.stop()
+
+
+if __name__ == "__main__":
+    main()
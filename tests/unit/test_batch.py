@@ -0,0 +1,48 @@
+import sys
+import os
+import threading
+
+import pytest
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.batch import Account, AccountResult, account_key, load_accounts, run_batch, summarize
+
+def test_load_accounts_skips_comments_and_blank_lines(tmp_path):
+    path = tmp_path / "accounts.csv"
+    path.write_text('# username,password\n4001,secret\n\n4002,"pa,ss"\n', encoding='utf-8')
+    assert load_accounts(str(path)) == [Account("4001", "secret"), Account("4002", "pa,ss")]
+    assert account_key("student/4001@pnu") == "student_4001_pnu"
+
+def test_load_accounts_rejects_colliding_keys(tmp_path):
+    path = tmp_path / "accounts.csv"
+    path.write_text('a/b,secret\na_b,secret\n', encoding='utf-8')
+    with pytest.raises(ValueError, match="clashes"):
+        load_accounts(str(path))
+
+def test_run_batch_bounds_workers_and_keeps_order():
+    active, peak, lock = [0], [0], threading.Lock()
+    # The first two accounts only finish once both run at the same time
+    both_started = threading.Barrier(2, timeout=5)
+
+    def runner(account):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        if account.username in ("a", "bad"):
+            both_started.wait()
+        with lock:
+            active[0] -= 1
+        if account.username == "bad":
+            return AccountResult(account.username, False, 0.02, error="login failed")
+        return AccountResult(account.username, True, 0.02, f"out/{account.username}.ics", 2, 10)
+
+    accounts = [Account(name, "x") for name in ["a", "bad", "c", "d", "e"]]
+    results, elapsed = run_batch(accounts, workers=2, runner=runner)
+    assert [result.username for result in results] == ["a", "bad", "c", "d", "e"]
+    assert peak[0] == 2
+
+    summary = summarize(results, elapsed)
+    assert (summary['succeeded'], summary['failed'], summary['sessions']) == (4, 1, 40)
+    assert summary['sessions_per_second'] > 0
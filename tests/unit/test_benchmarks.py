@@ -0,0 +1,23 @@
+import sys
+import os
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.session_parser import FastSessionParser
+from tests.benchmark.bench_pipeline import compare, percentile
+from tests.fixture.sample_data import generate_courses
+from tests.fixture.sample_html import generate_course_pages
+
+def test_generated_pages_parse_to_generated_courses():
+    parser = FastSessionParser()
+    parsed = [course for html in generate_course_pages(30, seed=7) for course in parser.parse(html)]
+    assert parsed == generate_courses(30, seed=7)
+
+def test_compare_flags_slower_stages_only():
+    baseline = {'results': {'parse': {'20': {'items_per_second': 1000, 'p99_ms': 2.0, 'peak_memory_kb': 100}}}}
+    faster = {'results': {'parse': {'20': {'items_per_second': 1200, 'p99_ms': 1.5, 'peak_memory_kb': 100}}}}
+    slower = {'results': {'parse': {'20': {'items_per_second': 500, 'p99_ms': 2.0, 'peak_memory_kb': 100}}}}
+    assert compare(faster, baseline) == []
+    assert compare(slower, baseline) == ["parse 20 courses: items_per_second 1000 -> 500"]
+    assert percentile([3, 1, 2, 4], 0.5) == 2
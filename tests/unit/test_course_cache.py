@@ -0,0 +1,34 @@
+import sys
+import os
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.course_cache import CourseCache
+from tests.fixture.builders import MATH
+
+CLASSES = [MATH]
+
+def test_lookup_requires_unchanged_html(tmp_path):
+    cache = CourseCache(str(tmp_path / "cache.json"), max_entries=10)
+    cache.put("course-1", "<h4>Math</h4>", CLASSES)
+    assert cache.lookup("course-1", "<h4>Math</h4>") == CLASSES
+    assert cache.lookup("course-1", "<h4>Math 2</h4>") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_save_round_trips_courses(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = CourseCache(path, max_entries=10)
+    cache.put("course-1", "<h4>Math</h4>", CLASSES)
+    cache.save()
+    assert CourseCache(path, max_entries=10).lookup("course-1", "<h4>Math</h4>") == CLASSES
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = CourseCache(str(tmp_path / "cache.json"), max_entries=2)
+    cache.put("course-1", "a", [])
+    cache.put("course-2", "b", [])
+    cache.get("course-1")
+    cache.put("course-3", "c", [])
+    assert cache.get("course-2") is None
+    assert cache.get("course-1") is not None
+    assert cache.get("course-3") is not None
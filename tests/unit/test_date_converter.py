@@ -2,10 +2,18 @@ import sys
 import os
 from datetime import datetime
 
+import pytest
+
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.date_converter import DateConverter
+from src.config import config
+
+@pytest.fixture
+def restore_date_cache():
+    yield
+    DateConverter.configure_cache(config.date_cache_size)
 
 def test_persian_to_english_numbers():
     assert DateConverter.persian_to_english_numbers("پنجشنبه ۲۱/۳/۱۳۸۳") == "پنجشنبه 21/3/1383"
@@ -73,4 +81,54 @@ def test_convert_persian_date_string():
         'date_object': datetime(2025, 10, 16, 18, 0),
         'full_date': "2025-10-16 18:00",
         'display': f"2025/10/16 - 18:00"
-    }
\ No newline at end of file
+    }
+
+def test_extract_date_components_day_equal_to_month():
+    assert DateConverter.extract_date_components("دوشنبه ۷ مهر ۱۴۰۴ - ۱۰:۰۰") == {
+        'year': '1404', 'month': '7', 'day': '7', 'time': '10:00', 'full_date': '1404/7/7 - 10:00', 'original_string': 'دوشنبه ۷ مهر ۱۴۰۴ - ۱۰:۰۰'
+    }
+
+def test_extract_date_components_general_layout_day_equal_to_month():
+    assert DateConverter.extract_date_components("۱۰:۰۰ - ۱۴۰۴ مرداد ۵") == {
+        'year': '1404', 'month': '5', 'day': '5', 'time': '10:00', 'full_date': '1404/5/5 - 10:00', 'original_string': '۱۰:۰۰ - ۱۴۰۴ مرداد ۵'
+    }
+
+def test_extract_date_components_general_layout():
+    assert DateConverter.extract_date_components("۱۸:۰۰ - ۱۴۰۴ مهر ۲۴") == {
+        'year': '1404', 'month': '7', 'day': '24', 'time': '18:00', 'full_date': '1404/7/24 - 18:00', 'original_string': '۱۸:۰۰ - ۱۴۰۴ مهر ۲۴'
+    }
+
+def test_conversion_cache_counts_hits_and_returns_copies(restore_date_cache):
+    DateConverter.configure_cache(16)
+    first = DateConverter.convert_persian_date_string("پنج شنبه ۲۴ مهر ۱۴۰۴ - ۱۸:۰۰")
+    first['display'] = "changed"
+    second = DateConverter.convert_persian_date_string("پنج شنبه ۲۴ مهر ۱۴۰۴ - ۱۸:۰۰")
+    assert second['display'] == "2025/10/16 - 18:00"
+    info = DateConverter.cache_info()
+    assert info['strings']['hits'] == 1 and info['strings']['misses'] == 1
+    assert info['dates']['hits'] == 1 and info['dates']['misses'] == 1
+
+def test_conversion_cache_is_bounded(restore_date_cache):
+    DateConverter.configure_cache(2)
+    for day in ("۱", "۲", "۳"):
+        DateConverter.convert_persian_date_string(f"شنبه {day} آبان ۱۴۰۴ - ۱۰:۰۰")
+    assert DateConverter.cache_info()['dates']['size'] == 2
+
+def test_convert_many_matches_single_conversion():
+    strings = [
+        "پنج شنبه ۲۴ مهر ۱۴۰۴ - ۱۸:۰۰",
+        "دوشنبه ۱۴ اسفند ۱۴۰۴ - ۰۸:۰۰",
+        "یکشنبه ۳۱ مهر ۱۴۰۴ - ۱۴:۰۰",
+        "",
+        "یکشنبه ۱۳ مهر ۱۴۰۴",
+    ]
+    batch = DateConverter.convert_many(strings)
+    assert len(batch) == 5
+    assert batch.valid.tolist() == [True, True, False, False, False]
+    assert batch.datetime_at(0) == datetime(2025, 10, 16, 18, 0)
+    assert batch.datetime_at(1) == DateConverter.convert_persian_date_string(strings[1])['date_object']
+    assert batch.datetime_at(2) is None
+    # A date without a time is not converted to midnight
+    assert batch.datetime_at(4) is None and DateConverter.to_datetime(strings[4]) is None
+    assert str(batch.to_datetime64()[0]) == "2025-10-16T18:00"
+    assert str(batch.to_datetime64()[4]) == "NaT"
@@ -0,0 +1,35 @@
+import sys
+import os
+
+from selenium.common.exceptions import WebDriverException
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.driver_pool import DriverPool
+from tests.fixture.builders import FakeDriver
+
+def test_pool_clones_session_cookies():
+    pool = DriverPool(FakeDriver, 3)
+    pool.start(FakeDriver())
+    assert len(pool._drivers) == 3
+    for driver in pool._drivers:
+        assert driver.cookies == [{'name': 'auth', 'value': 'token', 'domain': 'vc.farspnu.ac.ir', 'path': '/'}]
+    pool.close()
+
+def test_pool_replaces_crashed_driver():
+    pool = DriverPool(FakeDriver, 1)
+    pool.start(FakeDriver())
+    crashed = pool._drivers[0]
+
+    def task(driver):
+        if driver is crashed:
+            driver.crashed = True
+            raise WebDriverException("tab crashed")
+        return "ok"
+
+    assert pool.run(task) == "ok"
+    assert crashed.quit_called
+    assert crashed not in pool._drivers
+    assert len(pool._drivers) == 1
+    pool.close()
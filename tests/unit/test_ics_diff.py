@@ -0,0 +1,65 @@
+import sys
+import os
+from datetime import datetime, timezone
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.ics_creator import RETIRED_SEQUENCES_SUFFIX, IcsCreator
+from tests.fixture.builders import MATH, events_of, make_course, write_calendar
+
+SECOND_RUN = datetime(2025, 10, 2, 8, 0, tzinfo=timezone.utc)
+
+def test_read_events_unfolds_long_lines():
+    name = "ریاضی عمومی ۱ - گروه آنلاین دانشکده فنی و مهندسی"
+    content, _ = write_calendar([make_course(("m-1", datetime(2025, 10, 5, 14)), name=name)])
+    event = events_of(content)["m-1"]
+    assert event.sequence == 0
+    assert event.properties[1] == f"SUMMARY:{name}"
+    assert event.raw in content
+
+def test_unchanged_changed_and_removed_events():
+    first, _ = write_calendar([make_course(("m-1", datetime(2025, 10, 5, 14)), ("m-2", datetime(2025, 10, 12, 14)),
+                                  ("m-3", datetime(2025, 10, 19, 14)))])
+    previous = events_of(first)
+    second, writer = write_calendar([make_course(("m-1", datetime(2025, 10, 5, 14)), ("m-2", datetime(2025, 10, 13, 10)),
+                                        ("m-4", datetime(2025, 10, 26, 14)))], previous, SECOND_RUN)
+
+    assert writer.stats == {'unchanged': 1, 'changed': 1, 'added': 1, 'cancelled': 1}
+    assert previous["m-1"].raw in second
+    events = events_of(second)
+    assert events["m-2"].sequence == 1
+    assert (events["m-4"].sequence, events["m-3"].sequence) == (0, 1)
+    assert "STATUS:CANCELLED" in events["m-3"].properties
+
+def test_cancelled_event_is_dropped_on_later_runs():
+    first, _ = write_calendar([make_course(("m-1", datetime(2025, 10, 5, 14)))])
+    second, _ = write_calendar([make_course()], events_of(first), SECOND_RUN)
+    assert "m-1" in events_of(second)
+    third, writer = write_calendar([make_course()], events_of(second), SECOND_RUN.replace(day=3))
+    assert events_of(third) == {}
+    assert writer.stats['cancelled'] == 0
+
+def test_readded_event_outranks_its_dropped_cancellation():
+    session = ("m-1", datetime(2025, 10, 5, 14))
+    first, _ = write_calendar([make_course(session)])
+    second, _ = write_calendar([make_course()], events_of(first), SECOND_RUN)
+    third, writer = write_calendar([make_course()], events_of(second), SECOND_RUN.replace(day=3))
+    assert writer.retired == {"m-1": 1}
+
+    fourth, writer = write_calendar([make_course(session)], events_of(third), SECOND_RUN.replace(day=4),
+                                    retired=writer.retired)
+    assert events_of(fourth)["m-1"].sequence == 2
+    assert writer.retired == {}
+
+def test_dropped_sequences_are_kept_next_to_the_calendar(tmp_path):
+    creator = IcsCreator(str(tmp_path))
+    path = creator.create_ics_file([MATH], incremental=True)
+    creator.create_ics_file([], incremental=True)
+    creator.create_ics_file([], incremental=True)
+    assert os.path.exists(path + RETIRED_SEQUENCES_SUFFIX)
+
+    creator.create_ics_file([MATH], incremental=True)
+    with open(path, 'rb') as file:
+        assert events_of(file.read())["m-1"].sequence == 2
+    assert not os.path.exists(path + RETIRED_SEQUENCES_SUFFIX)
@@ -0,0 +1,64 @@
+import sys
+import os
+import io
+from datetime import datetime, timezone
+
+import pytest
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ics_creator import IcsCreator
+from src.ics_writer import IcsWriter, fold_line
+from src.models import Course, Session
+
+DTSTAMP = datetime(2025, 10, 1, 8, 30, tzinfo=timezone.utc)
+COURSES = [
+    Course("ریاضی عمومی ۱ - گروه " * 3, (
+        Session("c1-1", datetime(2025, 10, 5, 14, 0), datetime(2025, 10, 5, 16, 0)),
+        Session("c1-2", datetime(2025, 10, 12, 16, 0), datetime(2025, 10, 12, 14, 0)),
+    )),
+    Course("Physics", (Session("c2-1", datetime(2026, 3, 5, 8, 0), datetime(2026, 3, 5, 10, 0)),)),
+]
+
+def test_fold_line_keeps_octet_limit_and_utf8_sequences():
+    line = "SUMMARY:" + "ریاضی" * 30
+    folded = fold_line(line)
+    chunks = folded[:-2].split(b"\r\n")
+    assert all(len(chunk) <= 75 for chunk in chunks)
+    assert all(chunk.startswith(b" ") for chunk in chunks[1:])
+    assert b"".join(chunk[1:] if index else chunk for index, chunk in enumerate(chunks)).decode('utf-8') == line
+    assert fold_line("END:VEVENT") == b"END:VEVENT\r\n"
+
+def test_calendar_streams_from_generator_with_shared_dtstamp():
+    stream = io.BytesIO()
+    counts = IcsWriter(stream, DTSTAMP).write_calendar(course for course in COURSES)
+    content = stream.getvalue()
+    assert counts == (2, 2)
+    assert content.startswith(b"BEGIN:VCALENDAR\r\n") and content.endswith(b"END:VCALENDAR\r\n")
+    assert content.count(b"DTSTAMP:20251001T083000Z\r\n") == 2
+    assert b"UID:c1-2" not in content
+    assert b"DTSTART:20260305T080000\r\n" in content
+
+def test_text_stream_receives_same_calendar():
+    binary, text = io.BytesIO(), io.StringIO(newline='')
+    IcsWriter(binary, DTSTAMP).write_calendar(COURSES)
+    IcsWriter(text, DTSTAMP).write_calendar(COURSES)
+    assert text.getvalue().encode('utf-8') == binary.getvalue()
+
+def test_translating_text_file_keeps_crlf(tmp_path):
+    binary = io.BytesIO()
+    IcsWriter(binary, DTSTAMP).write_calendar(COURSES)
+    # Opened like a text file on Windows
+    with open(tmp_path / "calendar.ics", "w", encoding='utf-8', newline='\r\n') as file:
+        IcsWriter(file, DTSTAMP).write_calendar(COURSES)
+    assert (tmp_path / "calendar.ics").read_bytes() == binary.getvalue()
+
+def test_failed_write_leaves_no_temp_file(tmp_path):
+    def courses():
+        yield COURSES[0]
+        raise RuntimeError("scrape failed")
+
+    with pytest.raises(RuntimeError):
+        IcsCreator(str(tmp_path)).create_ics_file(courses(), incremental=False)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,36 @@
+import sys
+import os
+
+import jdatetime
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import jalali
+
+def test_matches_jdatetime_from_1300_to_1500():
+    persian_date = jdatetime.date(1300, 1, 1)
+    end = jdatetime.date(1501, 1, 1)
+    one_day = jdatetime.timedelta(days=1)
+    while persian_date < end:
+        gregorian = persian_date.togregorian()
+        expected_jalali = (persian_date.year, persian_date.month, persian_date.day)
+        expected_gregorian = (gregorian.year, gregorian.month, gregorian.day)
+        assert jalali.jalali_to_gregorian(*expected_jalali) == expected_gregorian
+        assert jalali.gregorian_to_jalali(*expected_gregorian) == expected_jalali
+        assert jalali.jalali_to_ordinal(*expected_jalali) == gregorian.toordinal()
+        persian_date += one_day
+
+def test_leap_years_match_jdatetime():
+    for year in range(1300, 1501):
+        assert jalali.is_leap_year(year) == jdatetime.date(year, 1, 1).isleap()
+
+def test_invalid_dates_are_rejected():
+    assert not jalali.is_valid_jalali(1404, 7, 31)
+    assert not jalali.is_valid_jalali(1404, 12, 30)
+    assert jalali.is_valid_jalali(1403, 12, 30)
+    try:
+        jalali.jalali_to_gregorian(1404, 13, 1)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
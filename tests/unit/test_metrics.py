@@ -0,0 +1,54 @@
+import sys
+import os
+import json
+
+import pytest
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.metrics import Metrics
+
+def test_spans_of_a_stage_are_aggregated():
+    metrics = Metrics(enabled=True)
+    with metrics.span("parse", items=3):
+        pass
+    with metrics.span("parse") as span:
+        span.add(2)
+        span.fail()
+    stats = metrics.report()['stages']['parse']
+    assert stats['calls'] == 2
+    assert stats['items'] == 5
+    assert stats['failures'] == 1
+    assert stats['seconds'] >= stats['max_seconds'] >= 0
+
+def test_exception_counts_as_failure_and_propagates():
+    metrics = Metrics(enabled=True)
+    with pytest.raises(ValueError):
+        with metrics.span("login"):
+            raise ValueError("rejected")
+    assert metrics.report()['stages']['login']['failures'] == 1
+
+def test_disabled_metrics_record_nothing(tmp_path):
+    metrics = Metrics(enabled=False)
+    with metrics.span("parse", items=1):
+        pass
+    metrics.record("convert", 0.1, 1)
+    assert metrics.report()['stages'] == {}
+    assert metrics.export(str(tmp_path / "m.json"), str(tmp_path / "m.prom")) is None
+
+def test_export_writes_json_and_prometheus_textfile(tmp_path):
+    metrics = Metrics(enabled=True)
+    metrics.record("course_page", 0.25, 1)
+    metrics.record("course_page", 0.5, 1, failed=True)
+    json_path, prometheus_path = metrics.export(str(tmp_path / "run.json"), str(tmp_path / "prom" / "run.prom"))
+
+    with open(json_path, encoding='utf-8') as file:
+        assert json.load(file)['stages']['course_page']['calls'] == 2
+    with open(prometheus_path, encoding='utf-8') as file:
+        text = file.read()
+    assert "# TYPE class_schedule_stage_duration_seconds gauge" in text
+    assert 'class_schedule_stage_duration_seconds{stage="course_page"} 0.75' in text
+    assert 'class_schedule_stage_failures{stage="course_page"} 1' in text
+    assert text.endswith("\n")
+    assert not os.path.exists(prometheus_path + ".tmp")
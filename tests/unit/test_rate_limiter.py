@@ -0,0 +1,85 @@
+import sys
+import os
+import threading
+import time
+
+import pytest
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.http_fetcher import HttpFetcher
+from src.rate_limiter import TokenBucket
+from tests.fixture.builders import make_governor
+
+URL = "https://vc.farspnu.ac.ir/Student/Course"
+
+def test_limit_grows_on_success_and_halves_on_throttling():
+    governor = make_governor()
+    for _ in range(10):
+        with governor.request(URL) as first, governor.request(URL) as second:
+            first.record(200)
+            second.record(200)
+    limiter = governor.for_host("vc.farspnu.ac.ir")
+    grown = limiter.limit
+    assert grown > 3
+
+    with governor.request(URL) as slot:
+        slot.record(429)
+    assert limiter.limit == grown / 2
+
+def test_limit_grows_only_while_binding_and_up_to_the_maximum():
+    governor = make_governor(initial_concurrency=1, max_concurrency=3)
+    limiter = governor.for_host("vc.farspnu.ac.ir")
+    for _ in range(10):
+        with governor.request(URL) as slot:
+            slot.record(200)
+    # One request at a time never needs a second slot
+    assert limiter.limit == 2
+
+    for _ in range(10):
+        with governor.request(URL) as first, governor.request(URL) as second:
+            first.record(200)
+            second.record(200)
+    assert limiter.limit == 3
+
+def test_exception_counts_as_failure():
+    governor = make_governor(initial_concurrency=4)
+    with pytest.raises(ConnectionError):
+        with governor.request(URL):
+            raise ConnectionError("reset")
+    limiter = governor.for_host("vc.farspnu.ac.ir")
+    assert (limiter.limit, limiter.in_flight) == (2, 0)
+
+def test_concurrency_is_bounded_per_host():
+    governor = make_governor(max_concurrency=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def request():
+        with governor.request(URL):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 2
+
+def test_token_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=100, burst=2)
+    started = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - started >= 0.025
+
+def test_http_fetcher_leaves_retries_to_the_governed_path():
+    fetcher = HttpFetcher(pool_size=1)
+    # Adapter retries would resend requests without a governor slot
+    assert fetcher.session.get_adapter(URL).max_retries.total == 0
+    fetcher.close()
@@ -0,0 +1,47 @@
+import sys
+import os
+import io
+from datetime import datetime, timedelta
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.ics_writer import IcsWriter
+from src.models import Course, Session
+from src.recurrence import WeeklySeries, group_weekly
+from tests.fixture.builders import DTSTAMP, events_of, weekly_sessions
+
+FIRST = datetime(2025, 10, 5, 14, 0)
+
+def expand(grouped):
+    for item in grouped:
+        if isinstance(item, WeeklySeries):
+            yield from item.occurrences()
+        else:
+            yield item.start, item.end
+
+def test_skipped_weeks_become_exdates():
+    sessions = weekly_sessions([0, 1, 3, 4, 5], FIRST)
+    [series] = group_weekly(sessions)
+    assert (series.uid, series.count, len(series)) == ("m-1-weekly", 6, 5)
+    assert series.exdates == (FIRST + timedelta(weeks=2),)
+    assert list(series.occurrences()) == [(session.start, session.end) for session in sessions]
+
+def test_off_pattern_sessions_stay_single_and_expand_to_same_set():
+    sessions = weekly_sessions([0, 1, 2, 3], FIRST) + weekly_sessions([10, 11], FIRST, prefix="late")
+    sessions += [Session("makeup", FIRST + timedelta(days=2), FIRST + timedelta(days=2, hours=2)),
+                 Session("long", FIRST + timedelta(weeks=4), FIRST + timedelta(weeks=4, hours=3)),
+                 Session("duplicate", FIRST, FIRST + timedelta(hours=2))]
+    grouped = group_weekly(sessions)
+    assert sum(isinstance(item, WeeklySeries) for item in grouped) == 1
+    assert sorted(expand(grouped)) == sorted((session.start, session.end) for session in sessions)
+
+def test_writer_emits_rrule_with_exdate():
+    stream = io.BytesIO()
+    course = Course("Math", tuple(weekly_sessions([0, 1, 3], FIRST) + [Session("x", FIRST, FIRST)]))
+    counts = IcsWriter(stream, DTSTAMP, recurrence=True).write_calendar([course])
+    events = events_of(stream.getvalue())
+    assert counts == (1, 3)
+    assert list(events) == ["m-1-weekly"]
+    assert "RRULE:FREQ=WEEKLY;COUNT=4" in events["m-1-weekly"].properties
+    assert "EXDATE:20251019T140000" in events["m-1-weekly"].properties
@@ -0,0 +1,32 @@
+import sys
+import os
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.run_journal import RunJournal
+from tests.fixture.builders import MATH
+
+COURSES = [MATH]
+
+def test_load_skips_line_cut_off_by_crash(tmp_path):
+    journal = RunJournal(str(tmp_path / "journal.jsonl"), max_age=60)
+    journal.record("course-1", COURSES)
+    journal.record("course-2", [])
+    with open(journal.path, "a", encoding='utf-8') as file:
+        file.write('{"url": "course-3", "cour')
+    assert journal.load() == {"course-1": COURSES, "course-2": []}
+
+def test_stale_journal_is_discarded(tmp_path):
+    journal = RunJournal(str(tmp_path / "journal.jsonl"), max_age=60)
+    journal.record("course-1", COURSES)
+    os.utime(journal.path, (0, 0))
+    assert journal.load() == {}
+    assert not os.path.exists(journal.path)
+
+def test_journal_of_another_account_is_discarded(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    RunJournal(path, max_age=60, owner="alice").record("course-1", COURSES)
+    assert RunJournal(path, max_age=60, owner="alice").load() == {"course-1": COURSES}
+    assert RunJournal(path, max_age=60, owner="bob").load() == {}
+    assert not os.path.exists(path)
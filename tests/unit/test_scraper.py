@@ -0,0 +1,193 @@
+import sys
+import os
+from datetime import datetime
+
+import pytest
+import requests
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.scraper import IncompleteRunError, Scraper
+from src.course_cache import CourseCache
+from src.config import config
+from tests.fixture.builders import FakeDriver, FakeFetcher, events_of, failing_first, make_scraper
+
+COURSES_HTML = """
+<table id="table">
+  <tr><th>Course</th></tr>
+  <tr><td><a href="/Student/Course/Sessions/1">Math</a></td></tr>
+  <tr style="background-color: #ffeeba;"><td><a href="/Student/Course/Sessions/2">Skipped</a></td></tr>
+  <tr><td><a href="/Student/Course/Sessions/3">Physics</a></td></tr>
+</table>
+"""
+
+COURSE_HTML = """
+<h4 class="text-info">Math</h4>
+<table class="table">
+  <tr><td>جلسه</td><td>یکشنبه ۱۳ مهر ۱۴۰۴ - ۱۴:۰۰</td><td>یکشنبه ۱۳ مهر ۱۴۰۴ - ۱۶:۰۰</td></tr>
+</table>
+"""
+
+def test_http_fetcher_receives_driver_cookies():
+    scraper = Scraper(FakeDriver(), None)
+    assert scraper.fetcher.session.cookies.get('auth') == 'token'
+    assert scraper.fetcher.session.headers['User-Agent'] == "test-agent"
+    scraper.close()
+
+def test_collect_course_rows_http_skips_highlighted_rows():
+    scraper = make_scraper({config.courses_url: COURSES_HTML})
+    rows, hrefs = scraper._collect_course_rows_http()
+    assert len(rows) == 3
+    assert hrefs == ["/Student/Course/Sessions/1", "/Student/Course/Sessions/3"]
+
+def test_collect_course_rows_http_without_table():
+    scraper = make_scraper({config.courses_url: "<p>Loading...</p>"})
+    assert scraper._collect_course_rows_http() == (None, None)
+
+def test_collect_sessions_http():
+    scraper = make_scraper({"course": COURSE_HTML})
+    page = scraper._collect_sessions_http("course")
+    assert page.html.startswith('<h4 class="text-info">Math</h4><td>جلسه</td>')
+    assert page.html.count("<td>") == 3
+    assert not page.not_modified
+
+def test_iter_course_pages_keeps_url_order(monkeypatch):
+    monkeypatch.setattr("src.scraper.backoff_delay", lambda attempt: 0)
+    pages = {f"course-{i}": COURSE_HTML.replace("Math", f"Course {i}") for i in range(20)}
+    scraper = make_scraper(pages)
+    scraper.max_concurrent_fetches = 4
+    results = list(scraper._iter_course_pages(["missing"] + list(pages)))
+    assert [page.html.split("<td>")[0] for page in results] == [
+        f'<h4 class="text-info">Course {i}</h4>' for i in range(20)
+    ]
+
+def test_pipeline_parses_pages_in_memory():
+    scraper = make_scraper({
+        config.courses_url: COURSES_HTML,
+        config.base_url + "/Student/Course/Sessions/1": COURSE_HTML,
+        config.base_url + "/Student/Course/Sessions/3": COURSE_HTML.replace("Math", "Physics"),
+    })
+    rows, hrefs = scraper._load_course_rows()
+    pages = scraper._iter_course_pages(scraper._course_urls(rows, hrefs))
+    results = [course for _, classes in scraper._iter_parsed_pages(pages) for course in classes]
+    assert [result.name for result in results] == ["Math", "Physics"]
+    assert len(results[0].sessions) == 1
+    assert results[0].sessions[0].start == datetime(2025, 10, 5, 14, 0)
+
+def test_debug_files_are_cleared_from_the_temp_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "persist_temp_files", True)
+    scraper = make_scraper({
+        config.courses_url: COURSES_HTML,
+        config.base_url + "/Student/Course/Sessions/1": COURSE_HTML,
+        config.base_url + "/Student/Course/Sessions/3": COURSE_HTML.replace("Math", "Physics"),
+    }, temp_dir=str(tmp_path / "temp"), output_dir=str(tmp_path / "out"))
+    scraper.go_to_courses()
+    assert all(path.startswith(str(tmp_path / "temp")) for path in scraper.temporary_files)
+    assert all(os.path.getsize(path) for path in scraper.temporary_files)
+
+    scraper.clear_temporary_files()
+    assert not any(os.path.getsize(path) for path in scraper.temporary_files)
+
+def test_unchanged_course_reuses_cached_sessions(tmp_path):
+    url = config.base_url + "/Student/Course/Sessions/1"
+    scraper = make_scraper({url: COURSE_HTML})
+    scraper.course_cache = CourseCache(str(tmp_path / "cache.json"))
+    first = list(scraper._iter_parsed_pages(scraper._iter_course_pages([url])))
+    scraper.course_cache.save()
+
+    scraper.course_cache = CourseCache(str(tmp_path / "cache.json"))
+    scraper._extract_class_sessions = None
+    second = list(scraper._iter_parsed_pages(scraper._iter_course_pages([url])))
+    assert second == first
+    assert scraper.course_cache.hits == 1
+
+def test_not_modified_course_reuses_cached_sessions(tmp_path):
+    url = config.base_url + "/Student/Course/Sessions/1"
+    scraper = make_scraper({url: COURSE_HTML})
+    scraper.fetcher = FakeFetcher({url: COURSE_HTML}, etags={url: '"v1"'})
+    scraper.course_cache = CourseCache(str(tmp_path / "cache.json"))
+    first = list(scraper._iter_parsed_pages(scraper._iter_course_pages([url])))
+    assert scraper.course_cache.get(url)['etag'] == '"v1"'
+
+    scraper.fetcher.pages = {}
+    scraper._extract_class_sessions = None
+    pages = list(scraper._iter_course_pages([url]))
+    assert pages[0].not_modified
+    assert list(scraper._iter_parsed_pages(pages)) == first
+
+def test_failed_page_is_retried(monkeypatch):
+    monkeypatch.setattr("src.scraper.backoff_delay", lambda attempt: 0)
+    scraper = make_scraper({"course": COURSE_HTML})
+    scraper.fetcher.fetch_conditional = failing_first(scraper.fetcher.fetch_conditional,
+                                                      TimeoutError("slow"), TimeoutError("slow"))
+    assert scraper._extract_course_sessions("course").url == "course"
+
+def test_course_list_load_is_retried(monkeypatch):
+    monkeypatch.setattr("src.scraper.backoff_delay", lambda attempt: 0)
+    scraper = make_scraper({config.courses_url: COURSES_HTML})
+    scraper.fetcher.fetch = failing_first(scraper.fetcher.fetch, requests.ConnectionError("reset"))
+    rows, hrefs = scraper._load_course_rows_with_retries()
+    assert len(hrefs) == 2
+
+def test_interrupted_run_resumes_from_journal(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.scraper.backoff_delay", lambda attempt: 0)
+    math_url = config.base_url + "/Student/Course/Sessions/1"
+    physics_url = config.base_url + "/Student/Course/Sessions/3"
+    pages = {config.courses_url: COURSES_HTML, math_url: COURSE_HTML}
+
+    scraper = make_scraper(pages, temp_dir=str(tmp_path / "temp"), output_dir=str(tmp_path / "out"))
+    with pytest.raises(IncompleteRunError):
+        scraper.go_to_courses()
+    assert not (tmp_path / "out" / "class_schedule.ics").exists()
+
+    pages[physics_url] = COURSE_HTML.replace("Math", "Physics")
+    scraper.fetcher.requests = 0
+    results = scraper.go_to_courses()
+    assert [course.name for course in results] == ["Math", "Physics"]
+    # Only the failed course page is fetched again
+    assert scraper.fetcher.requests == 1
+    assert (tmp_path / "out" / "class_schedule.ics").exists()
+    assert not (tmp_path / "temp" / "run_journal.jsonl").exists()
+
+def test_unreadable_page_fails_run_without_retries(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.scraper.backoff_delay", lambda attempt: 0)
+    pages = {
+        config.courses_url: COURSES_HTML,
+        config.base_url + "/Student/Course/Sessions/1": COURSE_HTML,
+        config.base_url + "/Student/Course/Sessions/3": "<p>Course removed</p>",
+    }
+    scraper = make_scraper(pages, temp_dir=str(tmp_path / "temp"), output_dir=str(tmp_path / "out"))
+    with pytest.raises(IncompleteRunError):
+        scraper.go_to_courses()
+    # Malformed pages are not retried
+    assert scraper.fetcher.requests == 2
+    assert not (tmp_path / "out" / "class_schedule.ics").exists()
+
+def test_unparseable_course_is_not_cancelled(tmp_path):
+    physics_url = config.base_url + "/Student/Course/Sessions/3"
+    pages = {
+        config.courses_url: COURSES_HTML,
+        config.base_url + "/Student/Course/Sessions/1": COURSE_HTML,
+        physics_url: COURSE_HTML.replace("Math", "Physics"),
+    }
+    scraper = make_scraper(pages, temp_dir=str(tmp_path / "temp"), output_dir=str(tmp_path / "out"))
+    scraper.course_cache = CourseCache(str(tmp_path / "cache.json"))
+    first = scraper.go_to_courses()
+    with open(tmp_path / "out" / "class_schedule.ics", "rb") as file:
+        published = events_of(file.read())
+
+    pages[physics_url] = pages[physics_url].replace("۱۶:۰۰", "??:??")
+    parse = scraper._extract_class_sessions
+
+    def fail_on_physics(html):
+        if "Physics" in html:
+            raise ValueError("unexpected date")
+        return parse(html)
+
+    scraper._extract_class_sessions = fail_on_physics
+    assert scraper.go_to_courses() == first
+    with open(tmp_path / "out" / "class_schedule.ics", "rb") as file:
+        content = file.read()
+    assert b"STATUS:CANCELLED" not in content
+    assert events_of(content).keys() == published.keys()
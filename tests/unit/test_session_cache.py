@@ -0,0 +1,31 @@
+import sys
+import os
+import stat
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.session_cache import SessionCache
+
+COOKIES = [{'name': 'auth', 'value': 'token', 'domain': 'vc.farspnu.ac.ir', 'path': '/'}]
+
+def test_save_and_load(tmp_path):
+    cache = SessionCache(str(tmp_path), ttl=60)
+    cache.save("student", COOKIES)
+    assert cache.load("student") == COOKIES
+    assert cache.load("other") is None
+    mode = os.stat(cache._path("student")).st_mode
+    assert stat.S_IMODE(mode) == 0o600
+
+def test_save_tightens_permissions_of_existing_file(tmp_path):
+    cache = SessionCache(str(tmp_path), ttl=60)
+    cache.save("student", COOKIES)
+    os.chmod(cache._path("student"), 0o644)
+    cache.save("student", COOKIES)
+    assert stat.S_IMODE(os.stat(cache._path("student")).st_mode) == 0o600
+
+def test_expired_session_is_discarded(tmp_path):
+    cache = SessionCache(str(tmp_path), ttl=-1)
+    cache.save("student", COOKIES)
+    assert cache.load("student") is None
+    assert not os.path.exists(cache._path("student"))
@@ -0,0 +1,41 @@
+import sys
+import os
+from datetime import datetime
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.models import unique_session_uids
+from src.session_parser import BeautifulSoupSessionParser, FastSessionParser, create_session_parser
+from tests.fixture.sample_html import COURSE_PAGES, generate_course_page
+
+def test_backends_produce_identical_output():
+    expected = BeautifulSoupSessionParser().parse(COURSE_PAGES)
+    assert FastSessionParser().parse(COURSE_PAGES) == expected
+    assert [result.name for result in expected] == ["ریاضی عمومی ۱", "Physics & Lab"]
+    # The session without valid dates is dropped
+    assert [len(result.sessions) for result in expected] == [3, 1]
+
+def test_fast_parser_reads_session_dates():
+    results = FastSessionParser().parse(COURSE_PAGES)
+    session = results[0].sessions[1]
+    assert (session.start, session.end) == (datetime(2025, 10, 12, 14, 0), datetime(2025, 10, 12, 16, 0))
+    assert session.uid == f"{results[0].course_id}-20251012T1400"
+
+def test_removing_a_session_keeps_other_uids():
+    times = [(datetime(2025, 10, day, 14, 0), datetime(2025, 10, day, 16, 0)) for day in (5, 12, 19)]
+    before = FastSessionParser().parse(generate_course_page("Math", times))[0].sessions
+    after = FastSessionParser().parse(generate_course_page("Math", times[1:]))[0].sessions
+    assert [session.uid for session in after] == [session.uid for session in before[1:]]
+
+def test_repeated_sessions_get_distinct_uids():
+    times = [(datetime(2025, 10, 5, 14, 0), datetime(2025, 10, 5, 16, 0))] * 2
+    repeated_row = FastSessionParser().parse(generate_course_page("Math", times))
+    same_section = FastSessionParser().parse(generate_course_page("Math", times[:1]))
+    uid = same_section[0].sessions[0].uid
+    courses = unique_session_uids(repeated_row + same_section)
+    assert [session.uid for course in courses for session in course.sessions] == [uid, f"{uid}-2", f"{uid}-3"]
+
+def test_unknown_backend_falls_back_to_beautifulsoup():
+    assert isinstance(create_session_parser("fast"), FastSessionParser)
+    assert isinstance(create_session_parser("lxml"), BeautifulSoupSessionParser)
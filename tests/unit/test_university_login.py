@@ -0,0 +1,36 @@
+import sys
+import os
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.metrics import metrics
+from src.university_login import UniversityLogin
+from tests.fixture.builders import FakeDriver, FakeElement
+
+LOGIN_PAGE = "https://vc.farspnu.ac.ir/Identity/Account/Login?returnUrl=%2F"
+
+
+def test_detect_login_outcome_on_redirect():
+    assert UniversityLogin._detect_login_outcome(FakeDriver("https://vc.farspnu.ac.ir/")) == "success"
+
+def test_detect_login_outcome_on_logout_link():
+    driver = FakeDriver(LOGIN_PAGE, logout_links=[FakeElement("Logout")])
+    assert UniversityLogin._detect_login_outcome(driver) == "success"
+
+def test_detect_login_outcome_on_validation_error():
+    driver = FakeDriver(LOGIN_PAGE, errors=[FakeElement("Invalid login attempt.")])
+    assert UniversityLogin._detect_login_outcome(driver) == "error"
+
+def test_detect_login_outcome_while_pending():
+    driver = FakeDriver(LOGIN_PAGE, errors=[FakeElement("", displayed=False)])
+    assert UniversityLogin._detect_login_outcome(driver) is False
+
+def test_login_detection_latency_is_recorded_as_metric():
+    metrics.reset()
+    portal = UniversityLogin()
+    portal.driver = FakeDriver("https://vc.farspnu.ac.ir/")
+    assert portal._wait_for_login_outcome() == "success"
+    stats = metrics.report()['stages']['login_detection']
+    assert (stats['calls'], stats['failures']) == (1, 0)
+    assert stats['seconds'] == round(portal.login_detection_seconds, 6)